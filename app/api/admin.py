@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from datetime import timedelta
 from app.database import get_db
@@ -7,6 +7,9 @@ from app.models.admin import Admin
 from app.core.security import verify_password, get_password_hash, create_access_token
 from app.utils.dependencies import get_current_admin
 from app.config import settings
+from app.core.retention import retention_job
+from app.core.term_index import term_index
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -65,7 +68,7 @@ def register_admin(
     db.commit()
     db.refresh(admin)
     
-    logger.info(f"Admin registered: {admin.username} (Total admins: {admin_count + 1})")
+    logger.info("Admin registered: %s (Total admins: %s)", admin.username, admin_count + 1)
     
     return admin
 
@@ -110,7 +113,7 @@ def login_admin(
         expires_delta=access_token_expires
     )
     
-    logger.info(f"Admin logged in: {admin.username}")
+    logger.info("Admin logged in: %s", admin.username)
     
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -126,3 +129,69 @@ def get_current_admin_info(
     Returns the authenticated admin's profile.
     """
     return current_admin
+
+
+def _run_retention(days: int):
+    """Background task body: errors are logged, never raised into the ASGI app"""
+    try:
+        retention_job.run_locked(days)
+    except Exception as e:
+        logger.error("Manual retention run failed: %s", e)
+
+
+@router.post("/retention/run", status_code=status.HTTP_202_ACCEPTED)
+def run_retention(
+    background_tasks: BackgroundTasks,
+    days: Optional[int] = Query(None, ge=1),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Archive and purge old feedback (Protected - Admin only)
+    
+    Rows older than `days` (default RETENTION_DAYS) are written to
+    NDJSON.gz archives in storage, deleted, and their screenshots removed.
+    Runs in the background; progress is logged.
+    """
+    days = days or settings.RETENTION_DAYS
+    if days <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Retention period not set. Pass days or configure RETENTION_DAYS."
+        )
+    
+    # Claimed here rather than in the task, so a run on any worker is a 409
+    if not retention_job.try_lock():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Retention job is already running"
+        )
+    
+    background_tasks.add_task(_run_retention, days)
+    
+    logger.info("Retention run started by admin: %s (days=%s)", current_admin.username, days)
+    
+    return {"status": "started", "days": days, "last_result": retention_job.last_result}
+
+
+@router.post("/terms/backfill", status_code=status.HTTP_202_ACCEPTED)
+def backfill_terms(
+    background_tasks: BackgroundTasks,
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Tokenize feedback not yet counted in term analytics (Protected - Admin only)
+    
+    Needed once after upgrading; new feedback is indexed as it arrives.
+    Runs in the background; progress is logged.
+    """
+    if term_index.running:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Term backfill is already running"
+        )
+    
+    background_tasks.add_task(term_index.backfill)
+    
+    logger.info("Term backfill started by admin: %s", current_admin.username)
+    
+    return {"status": "started", "last_result": term_index.last_result}
@@ -1,16 +1,37 @@
-from fastapi import APIRouter, Depends, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta
-from app.database import get_db
-from app.schemas.analytics import AnalyticsReport
+from app.config import settings
+from app.database import get_db, SessionLocal
+from app.schemas.analytics import AnalyticsReport, TopTermsReport
+from app.schemas.feedback import FeedbackListResponse
 from app.models.feedback import Feedback
 from app.models.admin import Admin
-from app.utils.dependencies import get_current_admin
+from app.utils.dependencies import get_current_admin, get_streaming_admin
+from app.core.live import live_feed, format_event
+from app.core.screenshot_urls import screenshot_urls
+from app.core.term_index import term_index
+from app.utils.http_cache import (
+    get_data_version,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    set_cache_headers
+)
+from app.core.serialization import (
+    FEEDBACK_COLUMNS,
+    FastJSONResponse,
+    fast_response,
+    feedback_row_to_dict,
+    serialize_feedbacks,
+    serialize_report
+)
+from typing import Iterator, List, Optional
 import csv
 import io
-import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +40,8 @@ router = APIRouter(prefix="/api/analytics", tags=["analytics"])
 
 @router.get("/reports", response_model=AnalyticsReport)
 def get_analytics_report(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
@@ -30,10 +53,22 @@ def get_analytics_report(
     - Overall average rating
     - Average ratings for last 30, 60, 90 days
     - Rating distribution (1-5)
+    
+    Supports ETag revalidation: polls return 304 Not Modified until a
+    feedback is added or removed, or the hour changes.
     """
     from datetime import timezone
     now = datetime.now(timezone.utc)
     
+    # Rolling windows drift with time, so the version also includes the hour
+    hour_start = now.replace(minute=0, second=0, microsecond=0)
+    count, max_id, latest_created_at = get_data_version(db)
+    etag = make_etag("report", count, max_id, latest_created_at, hour_start.isoformat())
+    # No Last-Modified: retention purges change the count but not max(created_at),
+    # so only the ETag can tell a client its copy is stale
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    
     # Total feedbacks
     total_feedbacks = db.query(func.count(Feedback.id)).scalar()
     
@@ -69,22 +104,154 @@ def get_analytics_report(
         if count > 0:
             unique_ratings_count += 1
     
-    logger.info(f"Analytics report generated by admin: {current_admin.username}")
+    logger.info("Analytics report generated by admin: %s", current_admin.username)
     
-    return {
+    report = {
         "total_feedbacks": total_feedbacks,
-        "overall_avg_rating": round(overall_avg, 2),
-        "avg_rating_last_30_days": round(avg_30_days, 2),
-        "avg_rating_last_60_days": round(avg_60_days, 2),
-        "avg_rating_last_90_days": round(avg_90_days, 2),
+        "overall_avg_rating": round(float(overall_avg), 2),
+        "avg_rating_last_30_days": round(float(avg_30_days), 2),
+        "avg_rating_last_60_days": round(float(avg_60_days), 2),
+        "avg_rating_last_90_days": round(float(avg_90_days), 2),
         "rating_distribution": rating_distribution,
         "unique_ratings": unique_ratings_count
     }
+    
+    if settings.FAST_JSON_RESPONSES:
+        return set_cache_headers(
+            FastJSONResponse(content=serialize_report(report)),
+            etag
+        )
+    
+    set_cache_headers(response, etag)
+    return report
+
+
+@router.get("/terms", response_model=TopTermsReport)
+def get_top_terms(
+    days: int = Query(30, ge=1, le=3650),
+    min_rating: int = Query(1, ge=1, le=5),
+    max_rating: int = Query(5, ge=1, le=5),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    Most mentioned description terms (Protected - Admin only)
+    
+    Merges precomputed per-day, per-rating counts, so the cost depends on
+    the window and vocabulary, not on the number of feedbacks. E.g. top
+    complaint terms: ?days=30&min_rating=1&max_rating=2
+    """
+    if min_rating > max_rating:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_rating must not exceed max_rating"
+        )
+    
+    terms = term_index.top_terms(db, days, min_rating, max_rating, limit)
+    return {
+        "days": days,
+        "min_rating": min_rating,
+        "max_rating": max_rating,
+        "terms": [{"term": term, "count": count} for term, count in terms]
+    }
+
+
+@router.get("/feedbacks", response_model=FeedbackListResponse)
+def list_feedbacks(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin)
+):
+    """
+    List feedbacks, newest first (Protected - Admin only)
+    
+    Paginated with skip/limit.
+    """
+    total = db.query(func.count(Feedback.id)).scalar()
+    
+    if settings.FAST_JSON_RESPONSES:
+        # Select plain columns and skip ORM objects and response validation
+        rows = (
+            db.query(*FEEDBACK_COLUMNS)
+            .order_by(Feedback.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return fast_response({
+            "total": total,
+            "feedbacks": screenshot_urls.sign_rows([feedback_row_to_dict(row) for row in rows])
+        })
+    
+    feedbacks = (
+        db.query(Feedback)
+        .order_by(Feedback.id.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    # Sign the page's screenshot URLs in one pass; serialization then hits the cache
+    screenshot_urls.prefetch(feedbacks)
+    
+    # Validated once here and rendered directly, so response_model does not re-validate the page
+    page = FeedbackListResponse.model_validate(
+        {"total": total, "feedbacks": feedbacks},
+        from_attributes=True
+    )
+    return Response(
+        content=page.model_dump_json(context={"sign_urls": True}),
+        media_type="application/json"
+    )
+
+
+@router.get("/live")
+async def live_feed_stream(
+    request: Request,
+    current_admin: Admin = Depends(get_streaming_admin)
+):
+    """
+    Live feed of new feedback as Server-Sent Events (Protected - Admin only)
+    
+    Events:
+    - metrics: current report figures, sent once on connect
+    - feedback: each new feedback with the change it caused and updated figures
+    
+    Comment lines are sent as heartbeats while idle.
+    """
+    queue = await live_feed.subscribe()
+    logger.info("Live feed opened by admin: %s", current_admin.username)
+    
+    async def events():
+        try:
+            yield format_event("metrics", live_feed.metrics.snapshot())
+            while not await request.is_disconnected():
+                try:
+                    yield await asyncio.wait_for(
+                        queue.get(),
+                        timeout=settings.LIVE_FEED_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield b": heartbeat\n\n"
+        finally:
+            live_feed.unsubscribe(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/download")
 def download_report(
     format: str = Query("csv", regex="^(csv|json)$"),
+    since: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Cursor from a previous export's X-Next-Cursor header - only newer feedbacks are returned"
+    ),
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
@@ -94,65 +261,119 @@ def download_report(
     Formats:
     - csv: CSV file
     - json: JSON file
+    
+    Incremental sync: pass `since` to get only feedbacks added after that
+    cursor, oldest first. Every export returns the cursor to use next time
+    in the X-Next-Cursor header; an interrupted incremental export can
+    resume with `since` set to the last id it received.
+    Rows are streamed in pages of EXPORT_PAGE_SIZE.
     """
-    # Get all feedbacks
-    feedbacks = db.query(Feedback).order_by(Feedback.created_at.desc()).all()
+    from datetime import timezone
+    
+    # Fix the upper bound before streaming so the cursor is known up front.
+    # Rows younger than the settle window are left for the next export, as
+    # an earlier id may still be committing.
+    settled_before = datetime.now(timezone.utc) - timedelta(seconds=settings.EXPORT_CURSOR_SETTLE_SECONDS)
+    next_cursor = db.query(func.max(Feedback.id)).filter(
+        Feedback.created_at <= settled_before
+    ).scalar() or 0
+    if since is not None:
+        next_cursor = max(next_cursor, since)
+    
+    pages = _export_pages(since, next_cursor)
+    filename = f"feedbacks-since-{since}" if since is not None else "feedbacks"
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}.{format}",
+        "X-Next-Cursor": str(next_cursor),
+        "Access-Control-Expose-Headers": "X-Next-Cursor"
+    }
+    
+    logger.info("%s report downloaded by admin: %s (since=%s)", format.upper(), current_admin.username, since)
     
     if format == "csv":
-        # Generate CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([
-            "ID", "Name", "Email", "Rating", "Description", 
-            "Screenshot URL", "Client IP", "Created At"
-        ])
-        
-        # Data rows
-        for feedback in feedbacks:
-            writer.writerow([
-                feedback.id,
-                feedback.name,
-                feedback.email,
-                feedback.rating,
-                feedback.description or "",
-                feedback.screenshot_url or "",
-                feedback.client_ip or "",
-                feedback.created_at.isoformat()
-            ])
-        
-        output.seek(0)
-        
-        logger.info(f"CSV report downloaded by admin: {current_admin.username}")
-        
         return StreamingResponse(
-            iter([output.getvalue()]),
+            _csv_chunks(pages),
             media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=feedbacks.csv"}
+            headers=headers
         )
     
     else:  # json
-        # Generate JSON
-        data = []
-        for feedback in feedbacks:
-            data.append({
-                "id": feedback.id,
-                "name": feedback.name,
-                "email": feedback.email,
-                "rating": feedback.rating,
-                "description": feedback.description,
-                "screenshot_url": feedback.screenshot_url,
-                "client_ip": feedback.client_ip,
-                "created_at": feedback.created_at.isoformat()
-            })
-        
-        json_data = json.dumps(data, indent=2)
-        
-        logger.info(f"JSON report downloaded by admin: {current_admin.username}")
-        
         return StreamingResponse(
-            iter([json_data]),
+            _json_chunks(pages),
             media_type="application/json",
-            headers={"Content-Disposition": "attachment; filename=feedbacks.json"}
+            headers=headers
         )
+
+
+def _export_pages(since: Optional[int], upper_id: int) -> Iterator[List[dict]]:
+    """
+    Yield feedbacks in keyset-paginated pages with id in (since, upper_id]
+    
+    Full exports are newest first; incremental ones oldest first so the
+    last id received is a valid resume cursor. Each page uses its own
+    short session so slow clients don't pin a pool connection.
+    """
+    ascending = since is not None
+    cursor = since if ascending else upper_id + 1
+    
+    while True:
+        db = SessionLocal()
+        try:
+            query = db.query(*FEEDBACK_COLUMNS).filter(Feedback.id <= upper_id)
+            if ascending:
+                query = query.filter(Feedback.id > cursor).order_by(Feedback.id)
+            else:
+                query = query.filter(Feedback.id < cursor).order_by(Feedback.id.desc())
+            page = [
+                feedback_row_to_dict(row)
+                for row in query.limit(settings.EXPORT_PAGE_SIZE).all()
+            ]
+        finally:
+            db.close()
+        
+        if not page:
+            return
+        yield page
+        cursor = page[-1]["id"]
+
+
+def _csv_chunks(pages: Iterator[List[dict]]) -> Iterator[str]:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    
+    # Header
+    writer.writerow([
+        "ID", "Name", "Email", "Rating", "Description", 
+        "Screenshot URL", "Client IP", "Created At"
+    ])
+    
+    # Data rows, one chunk per page
+    for page in pages:
+        for feedback in page:
+            writer.writerow([
+                feedback["id"],
+                feedback["name"],
+                feedback["email"],
+                feedback["rating"],
+                feedback["description"] or "",
+                feedback["screenshot_url"] or "",
+                feedback["client_ip"] or "",
+                feedback["created_at"].isoformat()
+            ])
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+    
+    # Header only when there were no rows
+    if output.tell():
+        yield output.getvalue()
+
+
+def _json_chunks(pages: Iterator[List[dict]]) -> Iterator[bytes]:
+    yield b"["
+    separator = b""
+    for page in pages:
+        # Splice each serialized page array into one top-level array
+        yield separator + serialize_feedbacks(page, indent=True)[1:-1]
+        separator = b","
+    yield b"]"
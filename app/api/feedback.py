@@ -1,19 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request,Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Request, Response, Form
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.feedback import FeedbackCreate, FeedbackResponse
 from app.models.feedback import Feedback
-from app.core.s3 import s3_manager
+from app.core.screenshots import store_screenshot
+from app.core.live import live_feed
+from app.core.term_index import term_index
+from app.core.serialization import FEEDBACK_COLUMNS, fast_response, feedback_row_to_dict
+from app.config import settings
+from app.utils.http_cache import make_etag, is_not_modified, not_modified, set_cache_headers
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/feedback", tags=["feedback"])
 
+# Feedback rows are never edited after insert, so clients may reuse them briefly
+FEEDBACK_CACHE_CONTROL = "private, max-age=60"
+
 
 @router.post("/", response_model=FeedbackResponse, status_code=status.HTTP_201_CREATED)
 async def submit_feedback(
     request: Request,
+    background_tasks: BackgroundTasks,
     name: str = Form(..., min_length=1, max_length=255),
     email: str = Form(...),
     rating: int = Form(..., ge=1, le=5),
@@ -26,7 +35,7 @@ async def submit_feedback(
     
     Captures:
     - Name, Email, Rating (1-5), Description
-    - Optional screenshot (uploaded to S3)
+    - Optional screenshot (optimized, thumbnailed and uploaded to S3)
     - Client IP address
     - Timestamp (auto-generated)
     """
@@ -48,19 +57,19 @@ async def submit_feedback(
     
     # Handle screenshot upload
     screenshot_url = None
+    thumbnail_url = None
     if screenshot:
-        # Validate file type
-        allowed_types = ["image/png", "image/jpeg", "image/jpg", "image/gif"]
-        if screenshot.content_type not in allowed_types:
+        # The type is sniffed from the file's magic bytes, not the
+        # client-supplied Content-Type; optimized in the worker pool, then uploaded
+        file_content = await screenshot.read()
+        try:
+            stored = await store_screenshot(file_content)
+        except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only image files (PNG, JPEG, GIF) are allowed"
+                detail="Only image files (PNG, JPEG, GIF, WebP) are allowed"
             )
-        
-        # Upload to S3
-        file_content = await screenshot.read()
-        file_extension = screenshot.filename.split(".")[-1] if "." in screenshot.filename else "png"
-        screenshot_url = s3_manager.upload_file(file_content, file_extension)
+        screenshot_url, thumbnail_url = stored
         
         if screenshot_url is None:
             logger.warning("S3 upload failed, proceeding without screenshot")
@@ -72,6 +81,7 @@ async def submit_feedback(
         rating=rating,
         description=description,
         screenshot_url=screenshot_url,
+        thumbnail_url=thumbnail_url,
         client_ip=client_ip
     )
     
@@ -79,7 +89,21 @@ async def submit_feedback(
     db.commit()
     db.refresh(feedback)
     
-    logger.info(f"Feedback submitted: ID={feedback.id}, Email={email}, Rating={rating}")
+    logger.info("Feedback submitted: ID=%s, Email=%s, Rating=%s", feedback.id, email, rating)
+    
+    # Push to open admin dashboards
+    live_feed.publish_local(feedback_row_to_dict(
+        getattr(feedback, column.key) for column in FEEDBACK_COLUMNS
+    ))
+    
+    # Update term analytics after the response has been sent
+    background_tasks.add_task(
+        term_index.index_feedback,
+        feedback.id,
+        feedback.rating,
+        feedback.description,
+        feedback.created_at
+    )
     
     return feedback
 
@@ -87,10 +111,19 @@ async def submit_feedback(
 @router.get("/{feedback_id}", response_model=FeedbackResponse)
 def get_feedback(
     feedback_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
-    """Get feedback by ID (for testing purposes)"""
-    feedback = db.query(Feedback).filter(Feedback.id == feedback_id).first()
+    """
+    Get feedback by ID (for testing purposes)
+    
+    Supports ETag/Last-Modified revalidation (304 Not Modified).
+    """
+    if settings.FAST_JSON_RESPONSES:
+        feedback = db.query(*FEEDBACK_COLUMNS).filter(Feedback.id == feedback_id).first()
+    else:
+        feedback = db.query(Feedback).filter(Feedback.id == feedback_id).first()
     
     if not feedback:
         raise HTTPException(
@@ -98,4 +131,18 @@ def get_feedback(
             detail="Feedback not found"
         )
     
+    # Public endpoint: screenshot URLs are returned as stored, never signed
+    etag = make_etag("feedback", feedback.id, feedback.created_at)
+    if is_not_modified(request, etag, feedback.created_at):
+        return not_modified(etag, feedback.created_at, FEEDBACK_CACHE_CONTROL)
+    
+    if settings.FAST_JSON_RESPONSES:
+        return set_cache_headers(
+            fast_response(feedback_row_to_dict(feedback)),
+            etag,
+            feedback.created_at,
+            FEEDBACK_CACHE_CONTROL
+        )
+    
+    set_cache_headers(response, etag, feedback.created_at, FEEDBACK_CACHE_CONTROL)
     return feedback
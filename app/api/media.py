@@ -0,0 +1,46 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse, Response
+from app.config import settings
+from app.core.storage import storage, LocalStorageBackend
+
+router = APIRouter(prefix="/media", tags=["media"])
+
+# Only these folders are publicly readable (archives etc. stay private)
+PUBLIC_FOLDERS = ("screenshots/",)
+
+
+@router.get("/{key:path}")
+def get_media(key: str):
+    """
+    Serve a file from local storage (Public API)
+    
+    Behind nginx with LOCAL_STORAGE_ACCEL_REDIRECT set, only headers are
+    returned and nginx sends the file itself via X-Accel-Redirect.
+    Otherwise the file is streamed by the app.
+    """
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="File not found"
+    )
+    
+    if not isinstance(storage, LocalStorageBackend) or not key.startswith(PUBLIC_FOLDERS):
+        raise not_found
+    
+    path = storage.path_for(key)
+    if path is None or not path.is_file():
+        raise not_found
+    # Check the resolved file, not the raw key, against the public folders
+    if not any(path.is_relative_to(storage.root / folder.rstrip("/")) for folder in PUBLIC_FOLDERS):
+        raise not_found
+    
+    content_type = storage.content_type_for(key)
+    # Stored names are unique and never rewritten
+    headers = {"Cache-Control": "public, max-age=31536000, immutable"}
+    
+    if settings.LOCAL_STORAGE_ACCEL_REDIRECT:
+        headers["X-Accel-Redirect"] = (
+            f"{settings.LOCAL_STORAGE_ACCEL_REDIRECT.rstrip('/')}/{storage.sharded_key(key)}"
+        )
+        return Response(media_type=content_type, headers=headers)
+    
+    return FileResponse(path, media_type=content_type, headers=headers)
@@ -1,7 +1,40 @@
 from pydantic_settings import BaseSettings
-from typing import List, Union
+from typing import Dict, List, Literal, Optional, Union
 from pydantic import field_validator
 import json
+import math
+import os
+
+
+def _cgroup_cpu_limit() -> Optional[float]:
+    """CPU quota of this container in cores, or None if it is not limited"""
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        # cgroup v1: quota of -1 means unlimited
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        return quota / period if quota > 0 and period > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """Cores this process may use: CPU affinity capped by the cgroup quota"""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(1, cpus)
 
 
 class Settings(BaseSettings):
@@ -17,6 +50,21 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    SQL_ECHO: bool = False  # Log every SQL statement (very verbose)
+    DB_MAX_CONNECTIONS: int = 151  # MySQL max_connections, shared by all workers
+    DB_RESERVED_CONNECTIONS: int = 10  # Left free for admin tools, migrations and other clients
+    DB_POOL_SIZE: Optional[int] = None  # Per worker; derived from WEB_WORKERS when unset
+    DB_MAX_OVERFLOW: Optional[int] = None  # Per worker; derived from WEB_WORKERS when unset
+    
+    # Server (python -m app.server)
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    WEB_WORKERS: int = 1  # Worker processes; 0 = one per available CPU core
+    
+    # Logging
+    LOG_FORMAT: Literal["json", "text"] = "json"
+    LOG_QUEUE_SIZE: int = 10000  # Records buffered for the writer thread; extra records are dropped
+    LOG_SAMPLING: Dict[str, float] = {}  # Logger prefix -> share of INFO/DEBUG records kept, e.g. {"uvicorn.access": 0.1}
     
     # JWT
     JWT_SECRET_KEY: str
@@ -29,6 +77,64 @@ class Settings(BaseSettings):
     AWS_REGION: str = "us-east-1"
     AWS_S3_BUCKET_NAME: str = ""  # Optional
     
+    # Storage
+    STORAGE_BACKEND: Literal["auto", "s3", "local"] = "auto"  # auto = S3 if configured, else local disk
+    LOCAL_STORAGE_PATH: str = "media"
+    LOCAL_STORAGE_BASE_URL: str = "/media"  # URL prefix served by app.api.media
+    LOCAL_STORAGE_ACCEL_REDIRECT: str = ""  # e.g. "/protected-media" to let nginx send files
+    
+    # Retention
+    RETENTION_DAYS: int = 0  # Archive and purge feedback older than this; 0 disables the schedule
+    RETENTION_INTERVAL_HOURS: float = 24.0
+    RETENTION_BATCH_SIZE: int = 5000  # Rows per archive file
+    RETENTION_DELETE_CHUNK_SIZE: int = 1000  # Rows deleted per transaction
+    
+    # Live feed
+    LIVE_FEED_MODE: Literal["inprocess", "poll"] = "inprocess"  # poll when running several workers
+    LIVE_FEED_POLL_INTERVAL_SECONDS: float = 2.0
+    LIVE_FEED_SETTLE_SECONDS: float = 5.0  # Newer ids are re-checked in case an earlier id commits late
+    LIVE_FEED_QUEUE_SIZE: int = 100  # Events buffered per client before the oldest are dropped
+    LIVE_FEED_HEARTBEAT_SECONDS: float = 15.0
+    LIVE_FEED_SNAPSHOT_TTL_SECONDS: float = 3600.0  # Re-read figures from the DB after this
+    
+    # Term analytics
+    TERM_INDEX_BATCH_SIZE: int = 1000  # Feedbacks tokenized per backfill transaction
+    
+    # Exports
+    EXPORT_PAGE_SIZE: int = 1000  # Rows fetched per query while streaming exports
+    EXPORT_CURSOR_SETTLE_SECONDS: int = 5  # Newer rows wait for the next incremental export
+    
+    # Load shedding (adaptive per-route-class concurrency limits)
+    CONCURRENCY_LIMIT_ENABLED: bool = True
+    CONCURRENCY_PUBLIC_WRITE_MAX: int = 20
+    CONCURRENCY_PUBLIC_WRITE_TARGET_MS: int = 500
+    CONCURRENCY_PUBLIC_READ_MAX: int = 10
+    CONCURRENCY_PUBLIC_READ_TARGET_MS: int = 500
+    CONCURRENCY_ADMIN_READ_MAX: int = 8
+    CONCURRENCY_ADMIN_READ_TARGET_MS: int = 2000
+    CONCURRENCY_EXPORT_MAX: int = 2
+    CONCURRENCY_EXPORT_TARGET_MS: int = 30000
+    CONCURRENCY_RETRY_AFTER_SECONDS: int = 2
+    
+    # Performance
+    FAST_JSON_RESPONSES: bool = False  # orjson responses that skip response_model re-validation
+    
+    # Screenshots
+    SCREENSHOT_PROCESSING: bool = True  # Optimize uploads (requires Pillow)
+    SCREENSHOT_MAX_DIMENSION: int = 1920  # Longest side in pixels after downscaling
+    SCREENSHOT_FORMAT: Literal["webp", "jpeg"] = "webp"
+    SCREENSHOT_QUALITY: int = 80
+    SCREENSHOT_MAX_PIXELS: int = 40_000_000  # Larger uploads are rejected before decoding
+    THUMBNAIL_MAX_DIMENSION: int = 320
+    IMAGE_WORKER_PROCESSES: int = 2
+    SIGNED_SCREENSHOT_URLS: bool = True  # Serve pre-signed GET URLs to admins (private S3 buckets)
+    SCREENSHOT_URL_EXPIRE_SECONDS: int = 3600
+    SCREENSHOT_URL_CACHE_SIZE: int = 10000  # Signed URLs kept for reuse
+    
+    # Health checks
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 10.0  # How often readiness dependencies are re-checked
+    HEALTH_POOL_SATURATION_THRESHOLD: float = 0.9  # Report not-ready above this share of pool in use
+    
     # CORS
     CORS_ORIGINS: Union[List[str], str] = ["http://localhost:3000", "http://localhost:5173", "http://localhost:8000"]
     
@@ -46,6 +152,13 @@ class Settings(BaseSettings):
         print(f"[CONFIG] CORS_ORIGINS already a list: {v}")
         return v
     
+    @property
+    def worker_count(self) -> int:
+        """Number of server worker processes (resolves WEB_WORKERS=0)"""
+        if self.WEB_WORKERS > 0:
+            return self.WEB_WORKERS
+        return available_cpus()
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
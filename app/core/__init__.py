@@ -5,12 +5,14 @@ from app.core.security import (
     create_access_token,
     verify_token
 )
-from app.core.s3 import s3_manager
+from app.core.storage import storage
+from app.core.health import health_monitor
 
 __all__ = [
     "verify_password",
     "get_password_hash",
     "create_access_token",
     "verify_token",
-    "s3_manager",
+    "storage",
+    "health_monitor",
 ]
@@ -0,0 +1,183 @@
+import time
+from typing import Dict, Optional
+from app.config import settings
+from app.database import BACKGROUND_CONNECTIONS, max_overflow, pool_size
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for one route class
+
+    Each fast response raises the limit by 1/limit (about +1 per full
+    window); a slow or failed response cuts it by BACKOFF, at most once per
+    target latency so a burst of slow responses counts as one signal.
+    Only touched from the event loop, so no locking is needed.
+    """
+
+    BACKOFF = 0.75
+
+    def __init__(self, name: str, max_limit: int, target_latency: float):
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = 1
+        self.target_latency = target_latency
+        self.limit = float(max(max_limit, self.min_limit))
+        self.in_flight = 0
+        self.rejected = 0
+        self._last_decrease = 0.0
+
+    def try_acquire(self) -> bool:
+        if self.in_flight >= int(self.limit):
+            self.rejected += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, latency: float, failed: bool):
+        self.in_flight -= 1
+        now = time.monotonic()
+
+        if failed or latency > self.target_latency:
+            if now - self._last_decrease >= self.target_latency:
+                self.limit = max(self.min_limit, self.limit * self.BACKOFF)
+                self._last_decrease = now
+                logger.warning("Concurrency limit for %s lowered to %s", self.name, int(self.limit))
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def status(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "rejected": self.rejected
+        }
+
+
+def clamp_to_pool(maxima: Dict[str, int], connections: int) -> Dict[str, int]:
+    """
+    Scale per-class maxima down to what this worker's DB pool can serve
+
+    With many workers sharing DB_MAX_CONNECTIONS the derived pool can be
+    smaller than the configured limits; admitting more requests than
+    there are connections would just queue them on the pool again.
+    """
+    capacity = max(len(maxima), connections - BACKGROUND_CONNECTIONS)
+    requested = sum(maxima.values())
+    if requested <= capacity:
+        return maxima
+
+    scale = capacity / requested
+    clamped = {name: max(1, int(limit * scale)) for name, limit in maxima.items()}
+    logger.warning(
+        "Concurrency limits %s exceed the %s DB connections per worker; clamped to %s",
+        maxima,
+        capacity,
+        clamped
+    )
+    return clamped
+
+
+_maxima = {
+    "public_write": settings.CONCURRENCY_PUBLIC_WRITE_MAX,
+    "public_read": settings.CONCURRENCY_PUBLIC_READ_MAX,
+    "admin_read": settings.CONCURRENCY_ADMIN_READ_MAX,
+    "export": settings.CONCURRENCY_EXPORT_MAX,
+}
+if settings.CONCURRENCY_LIMIT_ENABLED:
+    _maxima = clamp_to_pool(_maxima, pool_size + max_overflow)
+
+# Route classes with separate limits
+limiters: Dict[str, AdaptiveLimiter] = {
+    "public_write": AdaptiveLimiter(
+        "public_write",
+        _maxima["public_write"],
+        settings.CONCURRENCY_PUBLIC_WRITE_TARGET_MS / 1000
+    ),
+    "public_read": AdaptiveLimiter(
+        "public_read",
+        _maxima["public_read"],
+        settings.CONCURRENCY_PUBLIC_READ_TARGET_MS / 1000
+    ),
+    "admin_read": AdaptiveLimiter(
+        "admin_read",
+        _maxima["admin_read"],
+        settings.CONCURRENCY_ADMIN_READ_TARGET_MS / 1000
+    ),
+    "export": AdaptiveLimiter(
+        "export",
+        _maxima["export"],
+        settings.CONCURRENCY_EXPORT_TARGET_MS / 1000
+    ),
+}
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """Route class for a request, or None if it is not limited"""
+    # Public routes never share a budget with admins
+    if path.startswith("/api/feedback"):
+        return "public_write" if method == "POST" else "public_read"
+    if path.startswith("/api/analytics/download"):
+        return "export"
+    # The live feed is long-lived and holds no DB connection
+    if path.startswith("/api/analytics/live"):
+        return None
+    if path.startswith(("/api/analytics", "/api/admin")):
+        return "admin_read"
+    return None
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Sheds load per route class instead of queuing
+
+    Requests over their class limit get an immediate 503 with Retry-After,
+    so an export storm cannot starve public submissions of DB connections.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.CONCURRENCY_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify(scope["method"], scope["path"])
+        if route_class is None or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        limiter = limiters[route_class]
+        if not limiter.try_acquire():
+            await self._reject(send)
+            return
+
+        status_code = 500
+        started = time.monotonic()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            limiter.release(time.monotonic() - started, failed=status_code >= 500)
+
+    async def _reject(self, send):
+        body = b'{"detail":"Server is overloaded, please retry shortly"}'
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(settings.CONCURRENCY_RETRY_AFTER_SECONDS).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
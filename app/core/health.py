@@ -0,0 +1,115 @@
+import asyncio
+import time
+from typing import Optional
+from sqlalchemy import text
+from app.config import settings
+from app.database import engine
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """
+    Background dependency checker for the readiness probe
+
+    Probes never touch the database themselves; they read the last status
+    refreshed by `run()` every HEALTH_CHECK_INTERVAL_SECONDS.
+    """
+
+    def __init__(self):
+        self.status = {
+            "status": "starting",
+            "database": "unknown",
+            "storage": "disabled",
+            "pool": {},
+            "checked_at": None
+        }
+        self.ready = False
+        self._task: Optional[asyncio.Task] = None
+
+    def _check_database(self) -> bool:
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.error("Readiness check failed - Database error: %s", e)
+            return False
+
+    def _check_storage(self) -> str:
+        try:
+            from app.core.storage import storage
+            return storage.check()
+        except Exception as e:
+            logger.error("Readiness check failed - Storage error: %s", e)
+            return "unreachable"
+
+    def _pool_status(self) -> dict:
+        pool = engine.pool
+        size = pool.size()
+        checked_out = pool.checkedout()
+        capacity = size + max(getattr(pool, "_max_overflow", 0), 0)
+        saturation = checked_out / capacity if capacity else 0.0
+        return {
+            "size": size,
+            "checked_out": checked_out,
+            "overflow": pool.overflow(),
+            "capacity": capacity,
+            "saturation": round(saturation, 2)
+        }
+
+    def refresh(self) -> dict:
+        """Run all dependency checks once (blocking - call from a thread)"""
+        database_ok = self._check_database()
+        storage_status = self._check_storage()
+        pool_status = self._pool_status()
+        saturated = pool_status["saturation"] >= settings.HEALTH_POOL_SATURATION_THRESHOLD
+
+        ready = database_ok and storage_status != "unreachable" and not saturated
+        if saturated:
+            logger.warning("Readiness check failed - Pool saturated: %s", pool_status)
+
+        self.status = {
+            "status": "ready" if ready else "unavailable",
+            "database": "connected" if database_ok else "disconnected",
+            "storage": storage_status,
+            "pool": pool_status,
+            "checked_at": time.time()
+        }
+        self.ready = ready
+        return self.status
+
+    async def run(self):
+        """Refresh the cached status forever on a fixed interval"""
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                logger.error("Readiness refresh crashed: %s", e)
+                self.status = {**self.status, "status": "unavailable", "checked_at": time.time()}
+                self.ready = False
+            await asyncio.sleep(settings.HEALTH_CHECK_INTERVAL_SECONDS)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def is_stale(self) -> bool:
+        checked_at = self.status.get("checked_at")
+        if checked_at is None:
+            return True
+        return time.time() - checked_at > settings.HEALTH_CHECK_INTERVAL_SECONDS * 3
+
+
+# Global health monitor instance
+health_monitor = HealthMonitor()
@@ -0,0 +1,248 @@
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import func
+from app.config import settings
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+from app.core.serialization import FEEDBACK_COLUMNS, dumps, feedback_row_to_dict
+from app.core.screenshot_urls import screenshot_urls
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def format_event(event: str, data) -> bytes:
+    """Encode one Server-Sent Event"""
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+class RollingMetrics:
+    """
+    Report figures kept up to date incrementally
+
+    Loaded once from the database, then every new feedback only bumps
+    counters. Rolling averages use per-day buckets for the last 90 days.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.rating_sum = 0
+        self.distribution: Dict[str, int] = {str(rating): 0 for rating in range(1, 6)}
+        self.days: Dict[date, list] = {}  # day -> [count, rating sum]
+        self.loaded_at: Optional[float] = None
+
+    def load(self):
+        """Snapshot the figures from the database (blocking)"""
+        since = datetime.now(timezone.utc) - timedelta(days=90)
+        db = SessionLocal()
+        try:
+            distribution = dict(
+                db.query(Feedback.rating, func.count(Feedback.id))
+                .group_by(Feedback.rating)
+                .all()
+            )
+            days = (
+                db.query(
+                    func.date(Feedback.created_at),
+                    func.count(Feedback.id),
+                    func.sum(Feedback.rating)
+                )
+                .filter(Feedback.created_at >= since)
+                .group_by(func.date(Feedback.created_at))
+                .all()
+            )
+        finally:
+            db.close()
+
+        self.distribution = {str(rating): distribution.get(rating, 0) for rating in range(1, 6)}
+        self.total = sum(self.distribution.values())
+        self.rating_sum = sum(rating * count for rating, count in distribution.items())
+        self.days = {_as_date(day): [count, int(total or 0)] for day, count, total in days}
+        self.loaded_at = time.monotonic()
+
+    def add(self, feedback: dict) -> dict:
+        """Apply one new feedback, returning the change it caused"""
+        rating = feedback["rating"]
+        day = _as_date(feedback["created_at"] or datetime.now(timezone.utc))
+
+        self.total += 1
+        self.rating_sum += rating
+        self.distribution[str(rating)] += 1
+        bucket = self.days.setdefault(day, [0, 0])
+        bucket[0] += 1
+        bucket[1] += rating
+
+        return {"total_feedbacks": 1, "rating_distribution": {str(rating): 1}}
+
+    def _window_avg(self, days: int) -> float:
+        since = datetime.now(timezone.utc).date() - timedelta(days=days)
+        count = total = 0
+        for day, (day_count, day_total) in self.days.items():
+            if day >= since:
+                count += day_count
+                total += day_total
+        return round(total / count, 2) if count else 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "total_feedbacks": self.total,
+            "overall_avg_rating": round(self.rating_sum / self.total, 2) if self.total else 0.0,
+            "avg_rating_last_30_days": self._window_avg(30),
+            "avg_rating_last_60_days": self._window_avg(60),
+            "avg_rating_last_90_days": self._window_avg(90),
+            "rating_distribution": dict(self.distribution),
+            "unique_ratings": sum(1 for count in self.distribution.values() if count > 0)
+        }
+
+
+class LiveFeed:
+    """
+    In-process broadcaster for the admin live feed
+
+    Each event is encoded once and fanned out to bounded per-client queues;
+    a slow client loses its oldest events instead of growing memory. With
+    LIVE_FEED_MODE=poll (implied with several workers) a single id-watermark
+    poller per process picks up rows committed by any worker. Workers can
+    commit out of id order, so the watermark only moves past rows older
+    than LIVE_FEED_SETTLE_SECONDS; newer ids are re-read and de-duplicated.
+    """
+
+    POLL_BATCH_SIZE = 500
+
+    def __init__(self):
+        self.metrics = RollingMetrics()
+        self.watermark = 0  # Every id at or below has been published or has settled
+        self._seen: Set[int] = set()  # Published ids above the watermark
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._poller: Optional[asyncio.Task] = None
+
+    @property
+    def polling(self) -> bool:
+        # Another worker's commits never reach this process's publish_local
+        return settings.LIVE_FEED_MODE == "poll" or settings.worker_count > 1
+
+    async def subscribe(self) -> asyncio.Queue:
+        if not self._subscribers or self._metrics_stale():
+            await asyncio.to_thread(self.metrics.load)
+            self.watermark, self._seen = await asyncio.to_thread(self._settled_state)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.LIVE_FEED_QUEUE_SIZE)
+        self._subscribers.add(queue)
+
+        if self.polling and self._poller is None:
+            self._poller = asyncio.create_task(self._poll())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def _metrics_stale(self) -> bool:
+        loaded_at = self.metrics.loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at > settings.LIVE_FEED_SNAPSHOT_TTL_SECONDS
+
+    @staticmethod
+    def _settled_before() -> datetime:
+        return datetime.now(timezone.utc) - timedelta(seconds=settings.LIVE_FEED_SETTLE_SECONDS)
+
+    def _settled_state(self) -> Tuple[int, Set[int]]:
+        """Watermark for a fresh snapshot; newer rows are already in the metrics"""
+        db = SessionLocal()
+        try:
+            watermark = db.query(func.max(Feedback.id)).filter(
+                Feedback.created_at <= self._settled_before()
+            ).scalar() or 0
+            seen = {feedback_id for (feedback_id,) in db.query(Feedback.id).filter(Feedback.id > watermark)}
+            return watermark, seen
+        finally:
+            db.close()
+
+    def _broadcast(self, message: bytes):
+        for queue in self._subscribers:
+            if queue.full():
+                # Drop the oldest event for slow consumers
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    def publish(self, feedback: dict):
+        """Push a newly committed feedback to every subscriber (event loop only)"""
+        if not self._subscribers:
+            return
+
+        delta = self.metrics.add(feedback)
+        screenshot_urls.sign_rows([feedback])
+        self._broadcast(format_event("feedback", {
+            "feedback": feedback,
+            "delta": delta,
+            "metrics": self.metrics.snapshot()
+        }))
+
+    def publish_local(self, feedback: dict):
+        """Publish from the request that committed the row (in-process mode only)"""
+        if not self.polling:
+            self.publish(feedback)
+
+    def _fetch_new(self) -> Tuple[List[dict], int]:
+        """Rows above the watermark, and the id the watermark may advance to"""
+        db = SessionLocal()
+        try:
+            rows = [
+                feedback_row_to_dict(row)
+                for row in db.query(*FEEDBACK_COLUMNS)
+                .filter(Feedback.id > self.watermark)
+                .order_by(Feedback.id)
+                .limit(self.POLL_BATCH_SIZE)
+                .all()
+            ]
+            settled = db.query(func.max(Feedback.id)).filter(
+                Feedback.id > self.watermark,
+                Feedback.created_at <= self._settled_before()
+            ).scalar() or self.watermark
+        finally:
+            db.close()
+
+        if len(rows) == self.POLL_BATCH_SIZE:
+            # Never move past rows this batch did not include
+            settled = min(settled, rows[-1]["id"])
+        return rows, settled
+
+    async def _poll_once(self):
+        rows, settled = await asyncio.to_thread(self._fetch_new)
+        for feedback in rows:
+            if feedback["id"] not in self._seen:
+                self._seen.add(feedback["id"])
+                self.publish(feedback)
+        self.watermark = settled
+        self._seen = {feedback_id for feedback_id in self._seen if feedback_id > settled}
+
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(settings.LIVE_FEED_POLL_INTERVAL_SECONDS)
+            if not self._subscribers:
+                continue
+            try:
+                await self._poll_once()
+            except Exception as e:
+                logger.error("Live feed poll failed: %s", e)
+
+    async def stop(self):
+        if self._poller is not None:
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+
+
+# Global live feed instance
+live_feed = LiveFeed()
@@ -0,0 +1,208 @@
+import asyncio
+import gzip
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from app.config import settings
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+from app.core.serialization import FEEDBACK_COLUMNS, dumps, feedback_row_to_dict
+from app.core.storage import storage
+from app.core.term_index import term_index
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_LOCK_FILE = os.path.join(tempfile.gettempdir(), "clientpulse-retention.lock")
+RUN_LOCK_FILE = os.path.join(tempfile.gettempdir(), "clientpulse-retention-run.lock")
+
+
+def _flock(path: str):
+    """Open file holding a non-blocking exclusive lock on `path`, or None if taken"""
+    handle = open(path, "w")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+class RetentionJob:
+    """
+    Archives and purges feedback older than N days
+
+    Each batch is written to storage as one NDJSON.gz archive before its
+    rows are deleted (in chunked transactions) and its screenshots removed.
+    Runs hold a host-wide file lock, so scheduled and manual runs never
+    overlap across worker processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._run_lock = None
+        self._task: Optional[asyncio.Task] = None
+        self._schedule_lock = None
+        self.last_result: Optional[dict] = None
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def try_lock(self) -> bool:
+        """Claim the job for this process and, via a file lock, for every worker on the host"""
+        if not self._lock.acquire(blocking=False):
+            return False
+        if fcntl is not None:
+            self._run_lock = _flock(RUN_LOCK_FILE)
+            if self._run_lock is None:
+                self._lock.release()
+                return False
+        return True
+
+    def unlock(self):
+        if self._run_lock is not None:
+            # Closing the file releases the lock
+            self._run_lock.close()
+            self._run_lock = None
+        self._lock.release()
+
+    def _archive_batch(self, rows: List[dict], cutoff: datetime) -> Optional[str]:
+        lines = b"".join(dumps(row) + b"\n" for row in rows)
+        key = (
+            f"archives/feedbacks/{cutoff:%Y-%m-%d}/"
+            f"feedbacks-{rows[0]['id']}-{rows[-1]['id']}.ndjson.gz"
+        )
+        if not storage.save(key, gzip.compress(lines), "application/gzip"):
+            return None
+        return key
+
+    def _delete_rows(self, ids: List[int]):
+        chunk_size = settings.RETENTION_DELETE_CHUNK_SIZE
+        for start in range(0, len(ids), chunk_size):
+            db = SessionLocal()
+            try:
+                db.query(Feedback).filter(
+                    Feedback.id.in_(ids[start:start + chunk_size])
+                ).delete(synchronize_session=False)
+                db.commit()
+            finally:
+                db.close()
+
+    def run(self, days: int) -> dict:
+        """Archive and purge everything older than `days` (blocking)"""
+        if not self.try_lock():
+            raise RuntimeError("Retention job is already running")
+        return self.run_locked(days)
+
+    def run_locked(self, days: int) -> dict:
+        """Run with the lock already taken by try_lock(), then release it (blocking)"""
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+            result = {"days": days, "archived": 0, "files_deleted": 0, "archives": []}
+            last_id = 0
+            complete = False
+
+            while True:
+                db = SessionLocal()
+                try:
+                    rows = [
+                        feedback_row_to_dict(row)
+                        for row in db.query(*FEEDBACK_COLUMNS)
+                        .filter(Feedback.created_at < cutoff, Feedback.id > last_id)
+                        .order_by(Feedback.id)
+                        .limit(settings.RETENTION_BATCH_SIZE)
+                        .all()
+                    ]
+                finally:
+                    db.close()
+
+                if not rows:
+                    complete = True
+                    break
+
+                # Never delete rows that did not make it into an archive
+                key = self._archive_batch(rows, cutoff)
+                if key is None:
+                    logger.error("Retention stopped - failed to write archive")
+                    break
+
+                ids = [row["id"] for row in rows]
+                self._delete_rows(ids)
+
+                file_keys = [
+                    storage.key_from_url(url)
+                    for row in rows
+                    for url in (row["screenshot_url"], row["thumbnail_url"])
+                    if url
+                ]
+                deleted = storage.delete_many([k for k in file_keys if k])
+
+                last_id = ids[-1]
+                result["archived"] += len(rows)
+                result["files_deleted"] += deleted
+                result["archives"].append(key)
+                logger.info("Retention archived %s feedbacks to %s", len(rows), key)
+
+            if complete:
+                # Whole days before the cutoff no longer have any feedback
+                db = SessionLocal()
+                try:
+                    result["term_counts_deleted"] = term_index.purge_before(db, cutoff.date())
+                    db.commit()
+                finally:
+                    db.close()
+
+            logger.info(
+                "Retention finished: %s feedbacks archived, %s files deleted",
+                result["archived"],
+                result["files_deleted"]
+            )
+            self.last_result = result
+            return result
+        finally:
+            self.unlock()
+
+    async def schedule(self):
+        """Run every RETENTION_INTERVAL_HOURS while RETENTION_DAYS is set"""
+        while True:
+            try:
+                await asyncio.to_thread(self.run, settings.RETENTION_DAYS)
+            except Exception as e:
+                logger.error("Scheduled retention failed: %s", e)
+            await asyncio.sleep(settings.RETENTION_INTERVAL_HOURS * 3600)
+
+    def _claim_schedule(self) -> bool:
+        """Take a host-wide file lock so only one worker process runs the schedule"""
+        if fcntl is None:
+            return True
+        self._schedule_lock = _flock(SCHEDULE_LOCK_FILE)
+        return self._schedule_lock is not None
+
+    def start(self):
+        if self._task is None and settings.RETENTION_DAYS > 0 and self._claim_schedule():
+            self._task = asyncio.create_task(self.schedule())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._schedule_lock is not None:
+            # Closing the file releases the lock
+            self._schedule_lock.close()
+            self._schedule_lock = None
+
+
+# Global retention job instance
+retention_job = RetentionJob()
@@ -1,15 +1,18 @@
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional
-import uuid
+from typing import List, Optional
 from app.config import settings
+from app.core.storage import StorageBackend
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class S3Manager:
-    """AWS S3 manager for file uploads"""
+class S3Manager(StorageBackend):
+    """AWS S3 storage backend for file uploads"""
+    
+    name = "s3"
     
     def __init__(self):
         self.s3_client = None
@@ -30,75 +33,111 @@ class S3Manager:
                 's3',
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION
+                region_name=settings.AWS_REGION,
+                config=Config(signature_version="s3v4")  # Required for pre-signed URLs in newer regions
             )
             
             # Verify bucket exists and we have access
             self.s3_client.head_bucket(Bucket=self.bucket_name)
             self.enabled = True
-            logger.info(f"✅ S3 connection verified: {self.bucket_name}")
+            logger.info("✅ S3 connection verified: %s", self.bucket_name)
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == '404':
-                logger.error(f"S3 bucket '{self.bucket_name}' not found. S3 uploads disabled.")
+                logger.error("S3 bucket '%s' not found. S3 uploads disabled.", self.bucket_name)
             elif error_code == '403':
-                logger.error(f"Access denied to S3 bucket '{self.bucket_name}'. Check permissions.")
+                logger.error("Access denied to S3 bucket '%s'. Check permissions.", self.bucket_name)
             else:
-                logger.error(f"S3 initialization failed: {str(e)}. S3 uploads disabled.")
+                logger.error("S3 initialization failed: %s. S3 uploads disabled.", e)
             self.s3_client = None
         except Exception as e:
-            logger.error(f"S3 initialization failed: {str(e)}. S3 uploads disabled.")
+            logger.error("S3 initialization failed: %s. S3 uploads disabled.", e)
             self.s3_client = None
     
-    def upload_file(
-        self, 
-        file_content: bytes, 
-        file_extension: str,
-        folder: str = "screenshots"
-    ) -> Optional[str]:
+    def save(self, key: str, content: bytes, content_type: str) -> bool:
         if not self.enabled or not self.s3_client:
-            logger.warning("S3 uploads are disabled. Skipping upload.")
-            return None
+            return False
         
         try:
-            # Generate unique filename
-            filename = f"{folder}/{uuid.uuid4()}.{file_extension}"
-            
-            # Upload to S3
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
-                Key=filename,
-                Body=file_content,
-                ContentType=f"image/{file_extension}"
+                Key=key,
+                Body=content,
+                ContentType=content_type
             )
-            
-            # Generate URL
-            url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{filename}"
-            logger.info(f"File uploaded successfully: {url}")
-            return url
+            return True
             
         except ClientError as e:
-            logger.error(f"Failed to upload file to S3: {str(e)}")
-            return None
+            logger.error("Failed to upload file to S3: %s", e)
+            return False
     
-    def delete_file(self, file_url: str) -> bool:
-        """Delete file from S3 using its URL"""
+    def delete(self, key: str) -> bool:
+        if not self.enabled or not self.s3_client:
+            return False
+        
         try:
-            # Extract key from URL
-            key = file_url.split(f"{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/")[1]
-            
             self.s3_client.delete_object(
                 Bucket=self.bucket_name,
                 Key=key
             )
-            logger.info(f"File deleted successfully: {key}")
+            logger.info("File deleted successfully: %s", key)
             return True
             
-        except (ClientError, IndexError) as e:
-            logger.error(f"Failed to delete file from S3: {str(e)}")
+        except ClientError as e:
+            logger.error("Failed to delete file from S3: %s", e)
             return False
-
-
-# Global S3 manager instance
-s3_manager = S3Manager()
+    
+    def delete_many(self, keys: List[str]) -> int:
+        """Delete keys with batched delete_objects calls (max 1000 keys each)"""
+        if not self.enabled or not self.s3_client:
+            return 0
+        
+        deleted = 0
+        for start in range(0, len(keys), 1000):
+            batch = keys[start:start + 1000]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+                )
+                errors = response.get("Errors", [])
+                for error in errors:
+                    logger.error("Failed to delete %s from S3: %s", error.get("Key"), error.get("Message"))
+                deleted += len(batch) - len(errors)
+            except ClientError as e:
+                logger.error("Failed to delete files from S3: %s", e)
+        return deleted
+    
+    @property
+    def base_url(self) -> str:
+        return f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com"
+    
+    def url_for(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+    
+    def signed_url(self, key: str, expires_in: int) -> str:
+        """Pre-signed GET URL - computed locally, no request to S3"""
+        if not self.enabled or not self.s3_client:
+            return self.url_for(key)
+        return self.s3_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket_name, "Key": key},
+            ExpiresIn=expires_in
+        )
+    
+    def key_from_url(self, url: str) -> Optional[str]:
+        prefix = f"{self.base_url}/"
+        if not url.startswith(prefix):
+            return None
+        return url[len(prefix):]
+    
+    def check(self) -> str:
+        if not self.enabled or not self.s3_client:
+            return "disabled"
+        try:
+            self.s3_client.head_bucket(Bucket=self.bucket_name)
+            return "connected"
+        except Exception as e:
+            logger.error("S3 reachability check failed: %s", e)
+            return "unreachable"
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.config import settings
+from app.core.storage import storage
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Feedback fields holding stored screenshot URLs
+URL_FIELDS = ("screenshot_url", "thumbnail_url")
+
+
+class SignedURLCache:
+    """
+    Signed GET URLs for stored screenshots
+
+    Signing happens locally (no request to S3) but still costs an HMAC
+    chain per URL, so pages are signed in one pass and each URL is reused
+    from an LRU cache for REUSE_FRACTION of its lifetime. Clients therefore
+    always get a link with at least a fifth of its TTL left.
+    """
+
+    REUSE_FRACTION = 0.8
+
+    def __init__(self, max_size: int, expires_in: int):
+        self.max_size = max_size
+        self.expires_in = expires_in
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return settings.SIGNED_SCREENSHOT_URLS and storage.enabled
+
+    def _lookup(self, url: str, now: float) -> str:
+        entry = self._cache.get(url)
+        if entry is not None and entry[1] > now:
+            self._cache.move_to_end(url)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        key = storage.key_from_url(url)
+        # URLs from another bucket or backend are passed through unchanged
+        signed = url if key is None else storage.signed_url(key, self.expires_in)
+        self._cache[url] = (signed, now + self.expires_in * self.REUSE_FRACTION)
+        self._cache.move_to_end(url)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return signed
+
+    def sign_many(self, urls: Iterable[Optional[str]]) -> Dict[str, str]:
+        """Map each stored URL to its signed URL (one lock for the whole batch)"""
+        now = time.monotonic()
+        signed: Dict[str, str] = {}
+        with self._lock:
+            for url in urls:
+                if url and url not in signed:
+                    signed[url] = self._lookup(url, now)
+        return signed
+
+    def resolve(self, url: Optional[str]) -> Optional[str]:
+        """Signed URL for one stored URL (None and disabled signing pass through)"""
+        if not url or not self.enabled:
+            return url
+        return self.sign_many((url,))[url]
+
+    def sign_rows(self, feedbacks: List[dict]) -> List[dict]:
+        """Replace the screenshot URLs of a page of feedback dicts in place"""
+        if not self.enabled:
+            return feedbacks
+        signed = self.sign_many(feedback[field] for feedback in feedbacks for field in URL_FIELDS)
+        for feedback in feedbacks:
+            for field in URL_FIELDS:
+                if feedback[field]:
+                    feedback[field] = signed[feedback[field]]
+        return feedbacks
+
+    def prefetch(self, feedbacks: Iterable) -> None:
+        """Sign a page of ORM feedbacks up front so serialization only hits the cache"""
+        if self.enabled:
+            self.sign_many(getattr(feedback, field) for feedback in feedbacks for field in URL_FIELDS)
+
+    def status(self) -> dict:
+        return {"size": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+# Global signed URL cache instance
+screenshot_urls = SignedURLCache(
+    settings.SCREENSHOT_URL_CACHE_SIZE,
+    settings.SCREENSHOT_URL_EXPIRE_SECONDS
+)
@@ -0,0 +1,73 @@
+import uuid
+from typing import NamedTuple, Optional
+from starlette.concurrency import run_in_threadpool
+from app.config import settings
+from app.core.storage import storage
+from app.images import DECODE_ERRORS, ImageProcessor, ProcessedImage, sniff_image_type
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StoredScreenshot(NamedTuple):
+    """URLs of an uploaded screenshot and its thumbnail"""
+    url: Optional[str]
+    thumbnail_url: Optional[str] = None
+
+
+# Global image processor (process pool started on first upload)
+image_processor = ImageProcessor(max_workers=settings.IMAGE_WORKER_PROCESSES)
+
+
+async def store_screenshot(content: bytes, folder: str = "screenshots") -> StoredScreenshot:
+    """
+    Optimize a screenshot off the event loop and store it with its thumbnail
+
+    Raises ValueError if the content is not a supported image. If processing
+    fails for any other reason (e.g. a crashed pool worker), the original
+    upload is stored instead.
+    """
+    image_type = sniff_image_type(content)
+    if image_type is None:
+        raise ValueError("Unsupported image type")
+
+    processed = ProcessedImage(content=content, image_type=image_type)
+    if settings.SCREENSHOT_PROCESSING and image_processor.enabled:
+        try:
+            processed = await image_processor.process(
+                content,
+                settings.SCREENSHOT_MAX_DIMENSION,
+                settings.THUMBNAIL_MAX_DIMENSION,
+                settings.SCREENSHOT_FORMAT,
+                settings.SCREENSHOT_QUALITY,
+                settings.SCREENSHOT_MAX_PIXELS
+            )
+        except DECODE_ERRORS as e:
+            logger.warning("Screenshot rejected: %s", e)
+            raise ValueError("Invalid image file") from e
+        except Exception as e:
+            logger.error("Screenshot processing failed, storing the original: %r", e)
+
+    # Original and thumbnail share the same name so they sit next to each other
+    name = str(uuid.uuid4())
+    url = await run_in_threadpool(
+        storage.upload_file,
+        processed.content,
+        processed.extension,
+        folder,
+        processed.content_type,
+        name
+    )
+
+    thumbnail_url = None
+    if url and processed.thumbnail:
+        thumbnail_url = await run_in_threadpool(
+            storage.upload_file,
+            processed.thumbnail,
+            processed.extension,
+            folder,
+            processed.content_type,
+            f"{name}_thumb"
+        )
+
+    return StoredScreenshot(url=url, thumbnail_url=thumbnail_url)
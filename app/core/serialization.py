@@ -0,0 +1,86 @@
+from typing import Any, Iterable, List, Optional
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from app.models.feedback import Feedback
+from app.schemas.analytics import AnalyticsReport
+from app.schemas.feedback import FeedbackResponse
+
+try:
+    import orjson
+except ImportError:  # Optional - fall back to pydantic-core's JSON encoder
+    orjson = None
+
+
+# Columns selected for the row-tuple fast path, in FeedbackResponse field order
+FEEDBACK_COLUMNS = (
+    Feedback.id,
+    Feedback.name,
+    Feedback.email,
+    Feedback.rating,
+    Feedback.description,
+    Feedback.screenshot_url,
+    Feedback.thumbnail_url,
+    Feedback.client_ip,
+    Feedback.created_at,
+)
+FEEDBACK_FIELDS = tuple(column.key for column in FEEDBACK_COLUMNS)
+
+# Serializers are built once at import time instead of per response
+feedback_list_serializer = TypeAdapter(List[FeedbackResponse])
+analytics_report_serializer = TypeAdapter(AnalyticsReport)
+
+
+def dumps(content: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes with orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(content, option=option)
+    return to_json(content, indent=2 if indent else None)
+
+
+def feedback_row_to_dict(row: Iterable) -> dict:
+    """
+    Map a row selected with FEEDBACK_COLUMNS to a response dict
+
+    Rows come straight from our own table, so they are not re-validated
+    against FeedbackResponse.
+    """
+    return dict(zip(FEEDBACK_FIELDS, row))
+
+
+def serialize_feedbacks(feedbacks: List[dict], indent: bool = False) -> bytes:
+    """Serialize trusted feedback dicts as stored (screenshot URLs are not signed)"""
+    if orjson is not None:
+        return dumps(feedbacks, indent=indent)
+    return feedback_list_serializer.dump_json(
+        [FeedbackResponse.model_construct(**feedback) for feedback in feedbacks],
+        indent=2 if indent else None
+    )
+
+
+def serialize_report(report: dict) -> bytes:
+    """Serialize a trusted analytics report dict"""
+    if orjson is not None:
+        return dumps(report)
+    return analytics_report_serializer.dump_json(AnalyticsReport.model_construct(**report))
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (or pydantic-core) instead of json.dumps"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def fast_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[dict] = None
+) -> FastJSONResponse:
+    """Return already-serializable content, bypassing response_model validation"""
+    return FastJSONResponse(content=content, status_code=status_code, headers=headers)
@@ -0,0 +1,194 @@
+import hashlib
+import mimetypes
+import os
+import tempfile
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Optional
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+mimetypes.add_type("image/webp", ".webp")
+
+
+class StorageBackend(ABC):
+    """Interface for screenshot storage (S3, local disk)"""
+
+    name: str
+    enabled: bool = False
+
+    @abstractmethod
+    def save(self, key: str, content: bytes, content_type: str) -> bool:
+        """Store content under key, returning True on success"""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Delete the object stored under key"""
+
+    def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys, returning how many were deleted"""
+        return sum(1 for key in keys if self.delete(key))
+
+    @abstractmethod
+    def url_for(self, key: str) -> str:
+        """Public URL for a stored key"""
+
+    def signed_url(self, key: str, expires_in: int) -> str:
+        """Time-limited URL for reading a key (plain URL when the backend serves it itself)"""
+        return self.url_for(key)
+
+    @abstractmethod
+    def key_from_url(self, url: str) -> Optional[str]:
+        """Inverse of url_for - None if the URL does not belong to this backend"""
+
+    @abstractmethod
+    def check(self) -> str:
+        """Reachability for health checks: connected, unreachable or disabled"""
+
+    def upload_file(
+        self,
+        file_content: bytes,
+        file_extension: str,
+        folder: str = "screenshots",
+        content_type: Optional[str] = None,
+        name: Optional[str] = None
+    ) -> Optional[str]:
+        """Store a file under a unique key and return its URL (None on failure)"""
+        if not self.enabled:
+            logger.warning("Storage is disabled. Skipping upload.")
+            return None
+
+        key = f"{folder}/{name or uuid.uuid4()}.{file_extension}"
+        if not self.save(key, file_content, content_type or f"image/{file_extension}"):
+            return None
+
+        url = self.url_for(key)
+        logger.info("File uploaded successfully: %s", url)
+        return url
+
+    def delete_file(self, file_url: str) -> bool:
+        """Delete a file using its URL"""
+        key = self.key_from_url(file_url)
+        if key is None:
+            logger.error("Failed to delete file - not a storage URL: %s", file_url)
+            return False
+        return self.delete(key)
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    Local-disk storage
+
+    Files are written atomically (temp file + rename) and sharded into
+    two levels of subdirectories so no single directory grows unbounded.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str, base_url: str):
+        self.root = Path(root).resolve()
+        self.base_url = base_url.rstrip("/")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self.enabled = True
+            logger.info("✅ Local storage ready: %s", self.root)
+        except OSError as e:
+            logger.error("Local storage initialization failed: %s. Uploads disabled.", e)
+
+    @staticmethod
+    def sharded_key(key: str) -> str:
+        """screenshots/<name> -> screenshots/ab/cd/<name>"""
+        folder, _, filename = key.rpartition("/")
+        # Thumbnails shard with their original so they stay side by side
+        stem = filename.split(".")[0].removesuffix("_thumb")
+        digest = hashlib.md5(stem.encode()).hexdigest()
+        return "/".join(part for part in (folder, digest[:2], digest[2:4], filename) if part)
+
+    def path_for(self, key: str) -> Optional[Path]:
+        """Filesystem path for a key, or None if it is malformed or escapes the storage root"""
+        # Sharding hashes only the filename, so "a/../b/name" and "b/name" would
+        # map to the same file - refuse relative segments outright
+        if any(segment in ("", ".", "..") for segment in key.split("/")):
+            return None
+        path = (self.root / self.sharded_key(key)).resolve()
+        if not path.is_relative_to(self.root):
+            return None
+        return path
+
+    def save(self, key: str, content: bytes, content_type: str) -> bool:
+        path = self.path_for(key)
+        if path is None:
+            logger.error("Refusing to store file outside storage root: %s", key)
+            return False
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(content)
+                    tmp_file.flush()
+                    os.fsync(tmp_file.fileno())
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return True
+        except OSError as e:
+            logger.error("Failed to write file to local storage: %s", e)
+            return False
+
+    def delete(self, key: str) -> bool:
+        path = self.path_for(key)
+        try:
+            if path is None:
+                raise FileNotFoundError(key)
+            path.unlink()
+            logger.info("File deleted successfully: %s", key)
+            return True
+        except OSError as e:
+            logger.error("Failed to delete file from local storage: %s", e)
+            return False
+
+    def url_for(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def key_from_url(self, url: str) -> Optional[str]:
+        prefix = f"{self.base_url}/"
+        if not url.startswith(prefix):
+            return None
+        return url[len(prefix):]
+
+    def content_type_for(self, key: str) -> str:
+        return mimetypes.guess_type(key)[0] or "application/octet-stream"
+
+    def check(self) -> str:
+        if not self.enabled:
+            return "disabled"
+        return "connected" if os.access(self.root, os.W_OK) else "unreachable"
+
+
+def create_storage() -> StorageBackend:
+    """Build the configured storage backend (STORAGE_BACKEND=auto|s3|local)"""
+    from app.core.s3 import S3Manager
+
+    backend = settings.STORAGE_BACKEND
+    s3_configured = bool(
+        settings.AWS_ACCESS_KEY_ID
+        and settings.AWS_SECRET_ACCESS_KEY
+        and settings.AWS_S3_BUCKET_NAME
+    )
+
+    if backend == "s3" or (backend == "auto" and s3_configured):
+        return S3Manager()
+
+    if backend == "auto":
+        logger.warning("AWS S3 not configured. Storing uploads on local disk.")
+    return LocalStorageBackend(settings.LOCAL_STORAGE_PATH, settings.LOCAL_STORAGE_BASE_URL)
+
+
+# Global storage backend instance
+storage = create_storage()
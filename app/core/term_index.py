@@ -0,0 +1,177 @@
+import threading
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+from app.models.term_count import TermCount
+from app.terms import tokenize
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (day, rating, term) -> number of feedbacks
+Counts = Dict[Tuple[date, int, str], int]
+
+
+def _upsert_counts(db: Session, counts: Counts):
+    """Add counts to feedback_term_counts with one native upsert statement"""
+    if not counts:
+        return
+    rows = [
+        {"day": day, "rating": rating, "term": term, "count": count}
+        for (day, rating, term), count in counts.items()
+    ]
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(TermCount)
+        stmt = stmt.on_duplicate_key_update(count=TermCount.count + stmt.inserted["count"])
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(TermCount)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TermCount.day, TermCount.rating, TermCount.term],
+            set_={"count": TermCount.count + stmt.excluded["count"]}
+        )
+    else:
+        raise NotImplementedError(f"Term counts are not supported on {dialect}")
+    db.execute(stmt, rows)
+
+
+def _count_terms(counts: Counter, rating: int, description: Optional[str], created_at: Optional[datetime]):
+    day = (created_at or datetime.now(timezone.utc)).date()
+    for term in tokenize(description):
+        counts[(day, rating, term)] += 1
+
+
+class TermIndex:
+    """
+    Per-day, per-rating term counts over feedback descriptions
+
+    Each new feedback is tokenized in a background task after its response
+    is sent; older rows are picked up by a batched backfill. Feedback rows
+    are flagged (terms_indexed) in the same transaction that adds their
+    counts, so neither path can count a row twice. Top-term queries then
+    merge daily counts and never read descriptions.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.last_result: Optional[dict] = None
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def index_feedback(self, feedback_id: int, rating: int, description: Optional[str], created_at: Optional[datetime]):
+        """Count one newly inserted feedback (blocking - run as a background task)"""
+        counts: Counter = Counter()
+        _count_terms(counts, rating, description, created_at)
+
+        db = SessionLocal()
+        try:
+            # Claim the row; zero rows means a backfill already counted it
+            claimed = db.query(Feedback).filter(
+                Feedback.id == feedback_id,
+                Feedback.terms_indexed.is_(False)
+            ).update({Feedback.terms_indexed: True}, synchronize_session=False)
+            if claimed:
+                _upsert_counts(db, counts)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error("Failed to index terms of feedback %s: %s", feedback_id, e)
+        finally:
+            db.close()
+
+    def backfill(self) -> dict:
+        """Count every feedback not indexed yet, in batches (blocking)"""
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("Term backfill is already running")
+
+        try:
+            result = {"indexed": 0, "batches": 0}
+            last_id = 0
+
+            while True:
+                db = SessionLocal()
+                try:
+                    # Lock the batch so a concurrent index_feedback waits and then skips it
+                    rows = (
+                        db.query(Feedback.id, Feedback.rating, Feedback.description, Feedback.created_at)
+                        .filter(Feedback.terms_indexed.is_(False), Feedback.id > last_id)
+                        .order_by(Feedback.id)
+                        .limit(settings.TERM_INDEX_BATCH_SIZE)
+                        .with_for_update()
+                        .all()
+                    )
+                    if not rows:
+                        db.commit()
+                        break
+
+                    counts: Counter = Counter()
+                    for _, rating, description, created_at in rows:
+                        _count_terms(counts, rating, description, created_at)
+
+                    ids = [row.id for row in rows]
+                    _upsert_counts(db, counts)
+                    db.query(Feedback).filter(Feedback.id.in_(ids)).update(
+                        {Feedback.terms_indexed: True},
+                        synchronize_session=False
+                    )
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+                finally:
+                    db.close()
+
+                last_id = ids[-1]
+                result["indexed"] += len(ids)
+                result["batches"] += 1
+
+            logger.info("Term backfill finished: %s feedbacks indexed", result["indexed"])
+            self.last_result = result
+            return result
+        finally:
+            self._lock.release()
+
+    def top_terms(
+        self,
+        db: Session,
+        days: int,
+        min_rating: int = 1,
+        max_rating: int = 5,
+        limit: int = 20
+    ) -> List[Tuple[str, int]]:
+        """Most mentioned terms over the last `days` days for a rating range"""
+        since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+        total = func.sum(TermCount.count)
+        return [
+            (term, int(count))
+            for term, count in db.query(TermCount.term, total)
+            .filter(
+                TermCount.day >= since,
+                TermCount.rating.between(min_rating, max_rating)
+            )
+            .group_by(TermCount.term)
+            .order_by(total.desc(), TermCount.term)
+            .limit(limit)
+            .all()
+        ]
+
+    def purge_before(self, db: Session, day: date) -> int:
+        """Drop counts for days before `day` (used by retention)"""
+        return db.query(TermCount).filter(TermCount.day < day).delete(synchronize_session=False)
+
+
+# Global term index instance
+term_index = TermIndex()
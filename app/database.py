@@ -1,16 +1,76 @@
+import os
+from typing import Tuple
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Connections held outside request handling: health monitor, live feed poller, retention job
+BACKGROUND_CONNECTIONS = 3
+
+
+def pool_limits(workers: int) -> Tuple[int, int]:
+    """
+    Per-worker (pool_size, max_overflow)
+
+    Every worker process has its own pool, so the connection budget
+    (DB_MAX_CONNECTIONS minus DB_RESERVED_CONNECTIONS) is split evenly
+    between them. A worker never needs more connections than it can have
+    limited requests in flight plus its background jobs, so it takes no
+    more than that from its share.
+    """
+    budget = max(1, (settings.DB_MAX_CONNECTIONS - settings.DB_RESERVED_CONNECTIONS) // workers)
+    if settings.CONCURRENCY_LIMIT_ENABLED:
+        demand = (
+            settings.CONCURRENCY_PUBLIC_WRITE_MAX
+            + settings.CONCURRENCY_PUBLIC_READ_MAX
+            + settings.CONCURRENCY_ADMIN_READ_MAX
+            + settings.CONCURRENCY_EXPORT_MAX
+            + BACKGROUND_CONNECTIONS
+        )
+    else:
+        demand = 15  # SQLAlchemy's default 5 + 10 overflow
+    total = min(budget, demand)
+
+    pool_size = settings.DB_POOL_SIZE if settings.DB_POOL_SIZE is not None else max(1, total // 2)
+    max_overflow = settings.DB_MAX_OVERFLOW if settings.DB_MAX_OVERFLOW is not None else max(0, total - pool_size)
+
+    if pool_size + max_overflow > budget:
+        logger.warning(
+            "DB pool of %s+%s per worker x %s workers can exceed DB_MAX_CONNECTIONS=%s",
+            pool_size,
+            max_overflow,
+            workers,
+            settings.DB_MAX_CONNECTIONS
+        )
+    return pool_size, max_overflow
+
+
+pool_size, max_overflow = pool_limits(settings.worker_count)
 
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
+    pool_size=pool_size,
+    max_overflow=max_overflow,
     pool_pre_ping=True,  # Verify connections before using
     pool_recycle=3600,   # Recycle connections after 1 hour
-    echo=settings.DEBUG  # Log SQL queries in debug mode
+    echo=settings.SQL_ECHO  # Log SQL queries only when explicitly enabled
 )
 
+
+def _reset_pool_after_fork():
+    # Pooled sockets belong to the parent; drop them without closing so the
+    # parent's connections stay usable and the child opens its own
+    engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,180 @@
+"""
+Screenshot image processing
+
+Kept free of app imports so process-pool workers start without touching
+the database or S3 clients.
+"""
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple, Optional
+
+try:
+    from PIL import Image, ImageOps, UnidentifiedImageError
+except ImportError:  # Optional - screenshots are stored as uploaded without Pillow
+    Image = None
+
+# Errors meaning the upload itself is not a usable image
+if Image is not None:
+    DECODE_ERRORS = (ValueError, UnidentifiedImageError, Image.DecompressionBombError)
+else:
+    DECODE_ERRORS = (ValueError,)
+
+
+# Magic bytes -> image type
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+
+CONTENT_TYPES = {
+    "png": "image/png",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+}
+
+EXTENSIONS = {
+    "png": "png",
+    "jpeg": "jpg",
+    "gif": "gif",
+    "webp": "webp",
+}
+
+
+class ProcessedImage(NamedTuple):
+    """Result of processing one screenshot"""
+    content: bytes
+    image_type: str
+    thumbnail: Optional[bytes] = None
+
+    @property
+    def extension(self) -> str:
+        return EXTENSIONS[self.image_type]
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[self.image_type]
+
+
+def sniff_image_type(content: bytes) -> Optional[str]:
+    """Detect the real image type from magic bytes, ignoring client-supplied names"""
+    for signature, image_type in IMAGE_SIGNATURES:
+        if content.startswith(signature):
+            return image_type
+    if content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def _encode(image, output_format: str, quality: int) -> bytes:
+    if output_format == "jpeg" and image.mode != "RGB":
+        image = image.convert("RGB")
+    elif image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+
+    buffer = io.BytesIO()
+    # No exif/icc/info passed through - metadata is stripped on re-encode
+    image.save(buffer, format=output_format.upper(), quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def process_image(
+    content: bytes,
+    max_dimension: int,
+    thumbnail_dimension: int,
+    output_format: str,
+    quality: int,
+    max_pixels: int
+) -> ProcessedImage:
+    """
+    Strip metadata, downscale and re-encode a screenshot, and build a thumbnail
+
+    CPU-bound - runs inside a process-pool worker. Raises ValueError for
+    images over max_pixels before any pixel data is decoded.
+    """
+    image_type = sniff_image_type(content)
+    if image_type is None:
+        raise ValueError("Unsupported image type")
+
+    if Image is None:
+        return ProcessedImage(content=content, image_type=image_type)
+
+    with Image.open(io.BytesIO(content)) as image:
+        # Only the header has been read so far; a few KB of PNG can declare
+        # a canvas that takes hundreds of MB to decode
+        if image.width * image.height > max_pixels:
+            raise ValueError(f"Image of {image.width}x{image.height} pixels is too large")
+
+        # Keep animations intact - only stills are re-encoded
+        if getattr(image, "n_frames", 1) > 1:
+            return ProcessedImage(content=content, image_type=image_type)
+
+        # Apply EXIF orientation before the metadata is dropped
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+        processed = _encode(image, output_format, quality)
+
+        image.thumbnail((thumbnail_dimension, thumbnail_dimension), Image.LANCZOS)
+        thumbnail = _encode(image, output_format, quality)
+
+    return ProcessedImage(content=processed, image_type=output_format, thumbnail=thumbnail)
+
+
+class ImageProcessor:
+    """Runs process_image in a lazily started process pool"""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def enabled(self) -> bool:
+        return Image is not None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def process(
+        self,
+        content: bytes,
+        max_dimension: int,
+        thumbnail_dimension: int,
+        output_format: str,
+        quality: int,
+        max_pixels: int
+    ) -> ProcessedImage:
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            return await loop.run_in_executor(
+                executor,
+                process_image,
+                content,
+                max_dimension,
+                thumbnail_dimension,
+                output_format,
+                quality,
+                max_pixels
+            )
+        except BrokenProcessPool:
+            # A dead worker (e.g. OOM-killed) breaks the pool for good;
+            # start a fresh one on the next upload
+            if self._executor is executor:
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -1,15 +1,24 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import feedback_router, admin_router, analytics_router
+from fastapi.responses import JSONResponse
+from app.api import feedback_router, admin_router, analytics_router, media_router
 from app.config import settings
 from app.database import engine, Base
 from app.models import *  # Import all models
-from sqlalchemy import text
+from app.core.health import health_monitor
+from app.core.screenshots import image_processor
+from app.core.retention import retention_job
+from app.core.live import live_feed
+from app.core.concurrency import ConcurrencyLimitMiddleware, limiters
+from app.core.serialization import FastJSONResponse
+from app.core.logging_config import setup_logging, shutdown_logging
 
 # Create database table
 import logging
 
-# Configure logging
+# Configure logging (replaced by the queued setup in lifespan)
 logging.basicConfig(
     level=logging.DEBUG if settings.DEBUG else logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -18,15 +27,34 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background tasks with the application"""
+    log_listener = setup_logging()
+    health_monitor.start()
+    retention_job.start()
+    yield
+    await live_feed.stop()
+    await retention_job.stop()
+    await health_monitor.stop()
+    await asyncio.to_thread(image_processor.shutdown)
+    shutdown_logging(log_listener)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     description="Customer Satisfaction (CSAT) Feedback Collection and Analytics System",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
 )
 
+# Load shedding per route class (added first so CORS headers wrap its 503s)
+app.add_middleware(ConcurrencyLimitMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +68,7 @@ app.add_middleware(
 app.include_router(feedback_router)
 app.include_router(admin_router)
 app.include_router(analytics_router)
+app.include_router(media_router)
 
 
 @app.get("/")
@@ -52,43 +81,40 @@ def root():
     }
 
 
+@app.get("/health/live")
+def liveness_check():
+    """
+    Liveness probe - no I/O
+    Returns 200 as long as the process can serve requests
+    """
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+def readiness_check():
+    """
+    Readiness probe - served from the background health monitor
+    Returns 200 if ready, 503 if the database or storage is unreachable or the
+    connection pool is saturated
+    """
+    status = dict(health_monitor.status)
+    status["concurrency"] = {name: limiter.status() for name, limiter in limiters.items()}
+    ready = health_monitor.ready
+    if ready and health_monitor.is_stale():
+        status["status"] = "stale"
+        ready = False
+    if not ready:
+        return JSONResponse(status_code=503, content=status)
+    return status
+
+
 @app.get("/health")
 def health_check():
     """
-    Health check endpoint with database verification
-    Returns 200 if healthy, 503 if unhealthy
+    Health check endpoint (kept for existing deploy checks)
+    Same cached status as /health/ready
     """
-    health_status = {
-        "status": "healthy",
-        "database": "unknown",
-        "s3": "disabled"
-    }
-    
-    # Check database connection
-    try:
-        # Use engine directly instead of get_db() to avoid generator issues
-        with engine.connect() as connection:
-            connection.execute(text("SELECT 1"))
-        health_status["database"] = "connected"
-    except Exception as e:
-        logger.error(f"Health check failed - Database error: {str(e)}")
-        health_status["status"] = "unhealthy"
-        health_status["database"] = "disconnected"
-        raise HTTPException(
-            status_code=503,
-            detail="Service unavailable - Database connection failed"
-        )
-    
-    # Check S3 status
-    try:
-        from app.core.s3 import s3_manager
-        if s3_manager.enabled:
-            health_status["s3"] = "enabled"
-    except Exception:
-        # S3 check is optional, don't fail health check if it errors
-        health_status["s3"] = "not configured"
-    
-    return health_status
+    return readiness_check()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Models package - Import all models here for Alembic discovery"""
 from app.models.feedback import Feedback
 from app.models.admin import Admin
+from app.models.term_count import TermCount
 
-__all__ = ["Feedback", "Admin"]
+__all__ = ["Feedback", "Admin", "TermCount"]
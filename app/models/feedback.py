@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, CheckConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, CheckConstraint
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -14,8 +14,10 @@ class Feedback(Base):
     rating = Column(Integer, CheckConstraint('rating >= 1 AND rating <= 5'), nullable=False)
     description = Column(Text, nullable=True)
     screenshot_url = Column(String(500), nullable=True)
+    thumbnail_url = Column(String(500), nullable=True)
     client_ip = Column(String(45), nullable=False, default="unknown")  # IPv6 max length, automatically captured
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    terms_indexed = Column(Boolean, nullable=False, default=False, server_default="0")  # Counted in feedback_term_counts
     
     def __repr__(self):
         return f"<Feedback(id={self.id}, email={self.email}, rating={self.rating})>"
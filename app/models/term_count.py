@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, Date
+from app.database import Base
+
+
+class TermCount(Base):
+    """Number of feedbacks per day and rating whose description mentions a term"""
+
+    __tablename__ = "feedback_term_counts"
+
+    day = Column(Date, primary_key=True)
+    rating = Column(Integer, primary_key=True)
+    term = Column(String(64), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<TermCount(day={self.day}, rating={self.rating}, term={self.term}, count={self.count})>"
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Dict
+from typing import Dict, List
 
 
 class AnalyticsReport(BaseModel):
@@ -13,6 +13,20 @@ class AnalyticsReport(BaseModel):
     unique_ratings: int  # Number of different rating levels that have at least 1 response
 
 
+class TermFrequency(BaseModel):
+    """One term and the number of feedbacks mentioning it"""
+    term: str
+    count: int
+
+
+class TopTermsReport(BaseModel):
+    """Schema for the top terms report"""
+    days: int
+    min_rating: int
+    max_rating: int
+    terms: List[TermFrequency]
+
+
 class DownloadFormat(BaseModel):
     """Schema for download format query param"""
     format: str = "csv"  # csv or json
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, FieldSerializationInfo, field_serializer, field_validator
 from datetime import datetime
 from typing import Optional
+from app.core.screenshot_urls import screenshot_urls
 
 
 class FeedbackCreate(BaseModel):
@@ -26,9 +27,18 @@ class FeedbackResponse(BaseModel):
     rating: int
     description: Optional[str]
     screenshot_url: Optional[str]
+    thumbnail_url: Optional[str] = None
     client_ip: str  # Automatically captured, always present
     created_at: datetime
     
+    @field_serializer('screenshot_url', 'thumbnail_url')
+    def sign_screenshot_url(self, url: Optional[str], info: FieldSerializationInfo) -> Optional[str]:
+        # Signed links grant read access, so only admin routes opt in with
+        # context={"sign_urls": True}; everything else keeps the stored URL
+        if info.context and info.context.get("sign_urls"):
+            return screenshot_urls.resolve(url)
+        return url
+    
     class Config:
         from_attributes = True
 
@@ -0,0 +1,43 @@
+"""
+Production entry point
+
+    python -m app.server
+
+Starts WEB_WORKERS uvicorn worker processes (0 = one per CPU core) on
+HOST:PORT. Each worker has its own DB pool, sized by app.database so all
+workers together stay under DB_MAX_CONNECTIONS.
+"""
+import uvicorn
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    workers = settings.worker_count
+
+    # Import the app once up front so configuration errors fail here rather
+    # than in every worker. uvicorn spawns (not forks) its workers, so
+    # nothing opened here - DB connections, threads - is inherited.
+    from app.database import max_overflow, pool_size
+    import app.main  # noqa: F401
+
+    logger.info(
+        "Starting %s worker(s) on %s:%s, DB pool %s+%s per worker",
+        workers,
+        settings.HOST,
+        settings.PORT,
+        pool_size,
+        max_overflow
+    )
+    uvicorn.run(
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=workers
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Description tokenizer for term-frequency analytics
+
+Pure functions with no app imports, so backfills and scripts can use them
+without a database or settings.
+"""
+import re
+from typing import Optional, Set
+
+# Runs of letters, allowing inner apostrophes ("didn't", "l'app")
+TOKEN_PATTERN = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+
+MIN_TERM_LENGTH = 3
+MAX_TERM_LENGTH = 64  # Matches the term column
+
+STOPWORDS = frozenset("""
+    about above after again against all also and any are aren't because been before being
+    below between both but can can't cannot could couldn't did didn't does doesn't doing
+    don't down during each even ever every few for from further get got had hadn't has
+    hasn't have haven't having her here hers herself him himself his how i'd i'll i'm i've
+    into isn't it's its itself just let's like more most much mustn't myself nor not now
+    off once only other ought our ours ourselves out over own really same shan't she she'd
+    she'll she's should shouldn't some still such than that that's the their theirs them
+    themselves then there there's these they they'd they'll they're they've this those
+    through too under until very was wasn't we'd we'll we're we've were weren't what what's
+    when when's where where's which while who who's whom why why's will with won't would
+    wouldn't you you'd you'll you're you've your yours yourself yourselves
+""".split())
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    """
+    Distinct terms of a description
+
+    Lowercased, without stopwords and very short words. A term is counted
+    once per feedback, so one long rant cannot dominate the rankings.
+    """
+    if not text:
+        return set()
+    return {
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if MIN_TERM_LENGTH <= len(token) <= MAX_TERM_LENGTH and token not in STOPWORDS
+    }
@@ -1,4 +1,4 @@
 """Utils package"""
-from app.utils.dependencies import get_current_admin
+from app.utils.dependencies import get_current_admin, get_streaming_admin
 
-__all__ = ["get_current_admin"]
+__all__ = ["get_current_admin", "get_streaming_admin"]
@@ -1,7 +1,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer,HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.core.security import verify_token
 from app.models.admin import Admin
 
@@ -41,3 +41,17 @@ def get_current_admin(
         )
     
     return admin
+
+
+def get_streaming_admin(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Admin:
+    """
+    Same checks as get_current_admin, with a session closed right away
+    Used for long-lived streaming routes so they don't hold a DB connection
+    """
+    db = SessionLocal()
+    try:
+        return get_current_admin(credentials, db)
+    finally:
+        db.close()
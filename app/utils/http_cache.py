@@ -0,0 +1,91 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from fastapi import Request, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.feedback import Feedback
+
+
+def get_data_version(db: Session) -> tuple:
+    """
+    Cheap version of the feedbacks table: (count, max id, max created_at)
+
+    Changes on every insert and on retention purges, without touching
+    the rows themselves.
+    """
+    return db.query(
+        func.count(Feedback.id),
+        func.max(Feedback.id),
+        func.max(Feedback.created_at)
+    ).one()
+
+
+def make_etag(*parts) -> str:
+    """Build a quoted ETag from the given version parts"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_http_date(value: datetime) -> str:
+    return format_datetime(as_utc(value), usegmt=True)
+
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the current version"""
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence; compare weakly (ignore W/ prefixes)
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second precision
+        return as_utc(last_modified).replace(microsecond=0) <= as_utc(since)
+
+    return False
+
+
+def set_cache_headers(
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = "private, no-cache"
+) -> Response:
+    """Attach validators and caching hints to a response"""
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_http_date(last_modified)
+    response.headers["Cache-Control"] = cache_control
+    response.headers["Vary"] = "Authorization"
+    return response
+
+
+def not_modified(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = "private, no-cache"
+) -> Response:
+    """Empty 304 response carrying the same validators"""
+    return set_cache_headers(
+        Response(status_code=304),
+        etag,
+        last_modified,
+        cache_control
+    )
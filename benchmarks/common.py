@@ -0,0 +1,70 @@
+"""
+Shared setup for benchmarks
+
+Benchmarks run the real app in-process against a throwaway SQLite database,
+so they measure our own CPU cost per request (one core) without MySQL or
+network noise. Import this module before anything from `app`.
+"""
+import os
+import tempfile
+import time
+from typing import Callable
+
+_db_path = os.path.join(tempfile.mkdtemp(prefix="clientpulse-bench-"), "bench.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_path}")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("LOCAL_STORAGE_PATH", os.path.join(os.path.dirname(_db_path), "media"))
+
+
+def seed_feedbacks(count: int) -> None:
+    """Create tables and insert `count` feedback rows"""
+    from sqlalchemy import event
+    from app.database import Base, engine, SessionLocal
+    from app.models.feedback import Feedback
+
+    # Skip fsync on commit so writes measure our code, not the disk
+    @event.listens_for(engine, "connect")
+    def _no_fsync(connection, _):
+        connection.execute("PRAGMA synchronous=OFF")
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.bulk_save_objects([
+            Feedback(
+                name=f"Customer {i}",
+                email=f"customer{i}@example.com",
+                rating=i % 5 + 1,
+                description="The checkout page was slow and the app crashed twice",
+                screenshot_url=None,
+                client_ip="203.0.113.7"
+            )
+            for i in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def admin_headers(client) -> dict:
+    """Register and log in a benchmark admin, returning auth headers"""
+    credentials = {"username": "bench", "password": "benchmark-password"}
+    client.post("/api/admin/register", json={**credentials, "email": "bench@example.com"})
+    token = client.post("/api/admin/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def measure(label: str, request: Callable[[], object], seconds: float = 3.0) -> float:
+    """Call `request` in a loop for `seconds` and print requests per second"""
+    request()  # warm up
+    count = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < seconds:
+        request()
+        count += 1
+        elapsed = time.perf_counter() - started
+    rate = count / elapsed
+    print(f"{label:<48} {rate:>10.1f} req/s")
+    return rate
@@ -0,0 +1,58 @@
+"""
+Request throughput with synchronous vs queued logging
+
+Log output goes to a stream that takes 1 ms per write, standing in for a
+backpressured stdout or disk.
+
+    python -m benchmarks.log_throughput
+"""
+from benchmarks.common import admin_headers, measure, seed_feedbacks
+
+import io
+import logging
+import sys
+import time
+
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+class SlowStream(io.TextIOBase):
+    """Text stream whose writes block like a saturated pipe"""
+
+    def write(self, text):
+        time.sleep(0.001)
+        return len(text)
+
+
+def main():
+    seed_feedbacks(100)
+    slow = SlowStream()
+    sys.stdout, real_stdout = slow, sys.stdout
+    form = {"name": "Customer", "email": "customer@example.com", "rating": "4"}
+
+    try:
+        with TestClient(app) as client:
+            headers = admin_headers(client)
+            root = logging.getLogger()
+            queued_handlers = list(root.handlers)
+
+            results = []
+            for label, handlers in (
+                ("synchronous", [logging.StreamHandler(slow)]),
+                ("queued", queued_handlers),
+            ):
+                root.handlers[:] = handlers
+                results.append((label, [
+                    measure(f"POST /api/feedback/ [{label}]", lambda: client.post("/api/feedback/", data=form)),
+                    measure(f"GET /api/analytics/reports [{label}]", lambda: client.get("/api/analytics/reports", headers=headers)),
+                ]))
+    finally:
+        sys.stdout = real_stdout
+
+    for label, rates in results:
+        print(f"{label:<12} " + "  ".join(f"{rate:8.1f} req/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Requests per second on one core with FAST_JSON_RESPONSES off and on
+
+Each endpoint is measured with the flag off ("default") and on ("fast");
+the default side is the same endpoint's pydantic path, not older code.
+Exports do not depend on the flag and are measured once, next to the
+pre-streaming export (ORM objects and json.dumps) run in-process as the
+baseline.
+
+    python -m benchmarks.serialization
+"""
+from benchmarks.common import admin_headers, measure, seed_feedbacks
+
+import json
+import logging
+
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.database import SessionLocal
+from app.main import app
+from app.models.feedback import Feedback
+
+logging.disable(logging.INFO)
+
+
+def baseline_json_export() -> str:
+    """What GET /api/analytics/download?format=json cost before streaming row tuples"""
+    db = SessionLocal()
+    try:
+        feedbacks = db.query(Feedback).order_by(Feedback.created_at.desc()).all()
+        return json.dumps([
+            {
+                "id": feedback.id,
+                "name": feedback.name,
+                "email": feedback.email,
+                "rating": feedback.rating,
+                "description": feedback.description,
+                "screenshot_url": feedback.screenshot_url,
+                "client_ip": feedback.client_ip,
+                "created_at": feedback.created_at.isoformat()
+            }
+            for feedback in feedbacks
+        ], indent=2)
+    finally:
+        db.close()
+
+
+def main():
+    seed_feedbacks(2000)
+
+    with TestClient(app) as client:
+        headers = admin_headers(client)
+        endpoints = [
+            ("GET /api/feedback/1", "/api/feedback/1"),
+            ("GET /api/analytics/feedbacks?limit=500", "/api/analytics/feedbacks?limit=500"),
+            ("GET /api/analytics/reports", "/api/analytics/reports"),
+        ]
+        for label, path in endpoints:
+            for fast in (False, True):
+                settings.FAST_JSON_RESPONSES = fast
+                measure(
+                    f"{label} [{'fast' if fast else 'default'}]",
+                    lambda: client.get(path, headers=headers)
+                )
+
+        measure("json export [baseline, in-process]", baseline_json_export)
+        for export_format in ("json", "csv"):
+            measure(
+                f"GET /api/analytics/download?format={export_format}",
+                lambda: client.get(f"/api/analytics/download?format={export_format}", headers=headers)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Top complaint terms: scanning descriptions vs precomputed daily counts
+
+Seeds the table in steps, backfills the term index, and compares
+GET /api/analytics/terms with tokenizing every matching description.
+
+    python -m benchmarks.top_terms
+"""
+from benchmarks.common import admin_headers, measure, seed_feedbacks
+
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from app.main import app
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+from app.core.term_index import term_index
+from app.terms import tokenize
+
+WORDS = (
+    "checkout slow crashed login password payment refund delivery late support "
+    "friendly helpful broken screen loading error timeout search filter invoice"
+).split()
+
+
+def add_feedbacks(count: int):
+    now = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        db.bulk_save_objects([
+            Feedback(
+                name="Customer",
+                email="customer@example.com",
+                rating=random.randint(1, 5),
+                description=" ".join(random.choices(WORDS, k=12)),
+                client_ip="203.0.113.7",
+                created_at=now - timedelta(days=random.randint(0, 89))
+            )
+            for _ in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def scan_top_terms(days: int = 30, limit: int = 20):
+    """What the endpoint would cost without the index"""
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    db = SessionLocal()
+    try:
+        counts = Counter()
+        for (description,) in db.query(Feedback.description).filter(
+            Feedback.created_at >= since,
+            Feedback.rating <= 2
+        ):
+            counts.update(tokenize(description))
+        return counts.most_common(limit)
+    finally:
+        db.close()
+
+
+def main():
+    random.seed(1)
+    seed_feedbacks(0)
+    with TestClient(app) as client:
+        headers = admin_headers(client)
+        seeded = 0
+        for size in (10_000, 100_000):
+            add_feedbacks(size - seeded)
+            seeded = size
+            term_index.backfill()
+            measure(f"scan descriptions [{size} rows]", scan_top_terms, seconds=2)
+            measure(
+                f"GET /api/analytics/terms [{size} rows]",
+                lambda: client.get("/api/analytics/terms?days=30&max_rating=2", headers=headers),
+                seconds=2
+            )
+
+
+if __name__ == "__main__":
+    main()
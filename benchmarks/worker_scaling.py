@@ -0,0 +1,103 @@
+"""
+Throughput of `python -m app.server` with 1..N worker processes
+
+Starts the real server for each worker count and drives it from separate
+client processes, so the numbers include the HTTP stack. Workers only
+help up to the number of cores available to the server.
+
+    python -m benchmarks.worker_scaling [max_workers]
+"""
+from benchmarks.common import seed_feedbacks
+
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+DURATION = 5.0
+CLIENT_PROCESSES = 4
+PATH = "/api/analytics/feedbacks?limit=100"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_live(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health/live").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("Server did not start")
+
+
+def _token(base_url: str) -> str:
+    credentials = {"username": "bench", "password": "benchmark-password"}
+    httpx.post(f"{base_url}/api/admin/register", json={**credentials, "email": "bench@example.com"})
+    return httpx.post(f"{base_url}/api/admin/login", json=credentials).json()["access_token"]
+
+
+def _client(args) -> int:
+    """One load generator process: sequential keep-alive requests for DURATION"""
+    base_url, token = args
+    count = 0
+    with httpx.Client(base_url=base_url, headers={"Authorization": f"Bearer {token}"}) as client:
+        deadline = time.monotonic() + DURATION
+        while time.monotonic() < deadline:
+            if client.get(PATH).status_code == 200:
+                count += 1
+    return count
+
+
+def run(workers: int) -> float:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = {
+        **os.environ,
+        "WEB_WORKERS": str(workers),
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+        "CONCURRENCY_LIMIT_ENABLED": "false",
+        "LOG_SAMPLING": '{"uvicorn.access": 0}',
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_until_live(base_url)
+        token = _token(base_url)
+        with multiprocessing.Pool(CLIENT_PROCESSES) as pool:
+            completed = sum(pool.map(_client, [(base_url, token)] * CLIENT_PROCESSES))
+    finally:
+        server.terminate()
+        server.wait()
+    return completed / DURATION
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else len(os.sched_getaffinity(0))
+    seed_feedbacks(1000)
+
+    counts = sorted({1, *(2 ** i for i in range(1, max_workers.bit_length())), max_workers})
+    baseline = None
+    for workers in counts:
+        rate = run(workers)
+        baseline = baseline or rate
+        print(f"{workers:>3} worker(s) {rate:>10.1f} req/s {rate / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Test configuration
+
+Settings are read at import time, so the environment is set up here before
+anything from `app` is imported: a throwaway SQLite database and local
+storage in a temporary directory.
+"""
+import os
+import tempfile
+
+_tmp_dir = tempfile.mkdtemp(prefix="clientpulse-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp_dir, 'test.db')}")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("STORAGE_BACKEND", "local")
+os.environ.setdefault("LOCAL_STORAGE_PATH", os.path.join(_tmp_dir, "media"))
+os.environ.setdefault("LOCAL_STORAGE_ACCEL_REDIRECT", "")
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    from app.main import app
+    from app.database import Base, engine
+
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    """Register and log in a test admin, returning auth headers"""
+    credentials = {"username": "tester", "password": "test-password"}
+    client.post("/api/admin/register", json={**credentials, "email": "tester@example.com"})
+    token = client.post("/api/admin/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,28 @@
+import pytest
+from app.config import settings
+from app.core.concurrency import classify, limiters
+
+
+@pytest.mark.parametrize("method, path, route_class", [
+    ("POST", "/api/feedback/", "public_write"),
+    ("GET", "/api/feedback/42", "public_read"),
+    ("GET", "/api/analytics/feedbacks", "admin_read"),
+    ("POST", "/api/admin/retention/run", "admin_read"),
+    ("GET", "/api/analytics/download", "export"),
+    ("GET", "/api/analytics/live", None),
+    ("GET", "/health/ready", None),
+])
+def test_classify(method, path, route_class):
+    assert classify(method, path) == route_class
+
+
+def test_requests_over_the_limit_are_shed(client, admin_headers, monkeypatch):
+    limiter = limiters["admin_read"]
+    monkeypatch.setattr(limiter, "in_flight", int(limiter.limit))
+
+    response = client.get("/api/admin/me", headers=admin_headers)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == str(settings.CONCURRENCY_RETRY_AFTER_SECONDS)
+
+    # A full admin budget does not block public reads
+    assert client.get("/api/feedback/999999").status_code == 404
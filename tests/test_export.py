@@ -0,0 +1,110 @@
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.config import settings
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+
+CSV_HEADER = ["ID", "Name", "Email", "Rating", "Description", "Screenshot URL", "Client IP", "Created At"]
+
+
+def add_feedbacks(count: int, age: timedelta) -> list:
+    db = SessionLocal()
+    try:
+        feedbacks = [
+            Feedback(
+                name=f"Export {i}",
+                email="export@example.com",
+                rating=4,
+                client_ip="203.0.113.7",
+                created_at=datetime.now(timezone.utc) - age
+            )
+            for i in range(count)
+        ]
+        db.add_all(feedbacks)
+        db.commit()
+        return [feedback.id for feedback in feedbacks]
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def export_rows(client, monkeypatch):
+    """Five settled rows exported in pages of two, then one row inside the settle window"""
+    monkeypatch.setattr(settings, "EXPORT_PAGE_SIZE", 2)
+    monkeypatch.setattr(settings, "EXPORT_CURSOR_SETTLE_SECONDS", 60)
+    settled = add_feedbacks(5, timedelta(hours=1))
+    unsettled = add_feedbacks(1, timedelta(0))
+    return settled, unsettled[0]
+
+
+def download(client, headers, **params):
+    response = client.get("/api/analytics/download", params=params, headers=headers)
+    assert response.status_code == 200
+    return response
+
+
+def test_incremental_export_pages_oldest_first_after_since(client, admin_headers, export_rows):
+    settled, unsettled = export_rows
+    response = download(client, admin_headers, format="json", since=settled[0])
+
+    # `since` is exclusive, pages are spliced in order, and the fresh row is left out
+    assert [row["id"] for row in response.json()] == settled[1:]
+    assert response.headers["X-Next-Cursor"] == str(settled[-1])
+    assert unsettled > settled[-1]
+
+
+def test_interrupted_export_resumes_from_last_id(client, admin_headers, export_rows):
+    settled, _ = export_rows
+    first = download(client, admin_headers, format="json", since=settled[0] - 1).json()
+    received = [row["id"] for row in first][:3]
+
+    resumed = download(client, admin_headers, format="json", since=received[-1]).json()
+    assert received + [row["id"] for row in resumed] == settled
+
+
+def test_full_export_is_newest_first_and_settled(client, admin_headers, export_rows):
+    settled, unsettled = export_rows
+    response = download(client, admin_headers, format="json")
+    ids = [row["id"] for row in response.json()]
+
+    assert ids == sorted(ids, reverse=True)
+    assert ids[:5] == settled[::-1]
+    assert unsettled not in ids
+    assert response.headers["X-Next-Cursor"] == str(settled[-1])
+
+
+def test_settled_rows_are_picked_up_by_the_next_export(client, admin_headers, export_rows, monkeypatch):
+    settled, unsettled = export_rows
+    cursor = download(client, admin_headers, format="json").headers["X-Next-Cursor"]
+
+    monkeypatch.setattr(settings, "EXPORT_CURSOR_SETTLE_SECONDS", 0)
+    response = download(client, admin_headers, format="json", since=cursor)
+    assert [row["id"] for row in response.json()] == [unsettled]
+    assert response.headers["X-Next-Cursor"] == str(unsettled)
+
+
+def test_since_above_upper_bound_keeps_the_cursor(client, admin_headers, export_rows):
+    _, unsettled = export_rows
+    since = unsettled + 100
+    response = download(client, admin_headers, format="json", since=since)
+
+    assert response.json() == []
+    assert response.headers["X-Next-Cursor"] == str(since)
+
+
+def test_empty_csv_export_is_header_only(client, admin_headers, export_rows):
+    _, unsettled = export_rows
+    response = download(client, admin_headers, format="csv", since=unsettled)
+
+    assert list(csv.reader(io.StringIO(response.text))) == [CSV_HEADER]
+
+
+def test_csv_export_pages(client, admin_headers, export_rows):
+    settled, _ = export_rows
+    response = download(client, admin_headers, format="csv", since=settled[0] - 1)
+    rows = list(csv.reader(io.StringIO(response.text)))
+
+    assert rows[0] == CSV_HEADER
+    assert [int(row[0]) for row in rows[1:]] == settled
@@ -0,0 +1,66 @@
+import io
+from PIL import Image
+
+FORM = {"name": "Customer", "email": "customer@example.com", "rating": "4"}
+
+
+def png_bytes(size=(64, 48)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "red").save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def test_screenshot_type_is_sniffed_not_taken_from_client(client):
+    # Valid PNG sent with a generic MIME type is accepted and optimized
+    response = client.post(
+        "/api/feedback/",
+        data=FORM,
+        files={"screenshot": ("shot.png", png_bytes(), "application/octet-stream")}
+    )
+    assert response.status_code == 201
+    body = response.json()
+    assert body["screenshot_url"].endswith(".webp")
+    assert body["thumbnail_url"].endswith("_thumb.webp")
+
+
+def test_rejects_non_image_claiming_to_be_png(client):
+    response = client.post(
+        "/api/feedback/",
+        data=FORM,
+        files={"screenshot": ("shot.png", b"not an image", "image/png")}
+    )
+    assert response.status_code == 400
+
+
+def test_rejects_images_over_pixel_limit(client, monkeypatch):
+    from app.config import settings
+    monkeypatch.setattr(settings, "SCREENSHOT_MAX_PIXELS", 1000)
+    response = client.post(
+        "/api/feedback/",
+        data=FORM,
+        files={"screenshot": ("shot.png", png_bytes((100, 100)), "image/png")}
+    )
+    assert response.status_code == 400
+
+
+def test_uploads_survive_a_dead_pool_worker(client):
+    import os
+    import signal
+    from app.core.screenshots import image_processor
+
+    # Kill a pool worker, as the OOM killer would
+    pid = image_processor._get_executor().submit(os.getpid).result()
+    os.kill(pid, signal.SIGKILL)
+
+    urls = []
+    for _ in range(3):
+        response = client.post(
+            "/api/feedback/",
+            data=FORM,
+            files={"screenshot": ("shot.png", png_bytes(), "image/png")}
+        )
+        assert response.status_code == 201
+        urls.append(response.json()["screenshot_url"])
+
+    # The upload that hit the broken pool is stored as received; the pool is then restarted
+    assert urls[-1].endswith(".webp")
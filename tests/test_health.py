@@ -0,0 +1,37 @@
+import asyncio
+from app.core.health import health_monitor
+
+
+def _run_once():
+    async def run():
+        task = asyncio.create_task(health_monitor.run())
+        await asyncio.sleep(0.2)
+        task.cancel()
+    asyncio.run(run())
+
+
+def test_crashed_refresh_is_not_ready(client, monkeypatch):
+    health_monitor.refresh()
+    assert client.get("/health/ready").status_code == 200
+
+    def broken_pool_status():
+        raise RuntimeError("pool exploded")
+
+    monkeypatch.setattr(health_monitor, "_pool_status", broken_pool_status)
+    _run_once()
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "unavailable"
+
+    monkeypatch.undo()
+    health_monitor.refresh()
+
+
+def test_stale_status_is_not_ready(client, monkeypatch):
+    health_monitor.refresh()
+    monkeypatch.setattr(health_monitor, "is_stale", lambda: True)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "stale"
@@ -0,0 +1,79 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func
+from app.config import settings
+from app.core.live import LiveFeed
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+
+
+def insert_feedback(feedback_id: int, age_seconds: float = 0):
+    db = SessionLocal()
+    try:
+        db.add(Feedback(
+            id=feedback_id,
+            name="Customer",
+            email="customer@example.com",
+            rating=5,
+            client_ip="203.0.113.7",
+            created_at=datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def max_id() -> int:
+    db = SessionLocal()
+    try:
+        return db.query(func.max(Feedback.id)).scalar() or 0
+    finally:
+        db.close()
+
+
+def drain(queue: asyncio.Queue) -> list:
+    events = []
+    while not queue.empty():
+        data = queue.get_nowait().split(b"\ndata: ", 1)[1]
+        events.append(json.loads(data)["feedback"]["id"])
+    return events
+
+
+def test_poll_publishes_ids_that_commit_out_of_order(client, monkeypatch):
+    # Poll manually instead of starting the background poller
+    monkeypatch.setattr(settings, "LIVE_FEED_MODE", "inprocess")
+
+    async def scenario():
+        feed = LiveFeed()
+        queue = await feed.subscribe()
+        first = max_id() + 1
+
+        # A later id commits first (another worker), then the earlier one
+        insert_feedback(first + 1)
+        await feed._poll_once()
+        insert_feedback(first)
+        await feed._poll_once()
+        await feed._poll_once()
+
+        assert drain(queue) == [first + 1, first]
+        assert feed.metrics.total >= 2
+
+    asyncio.run(scenario())
+
+
+def test_poll_advances_watermark_past_settled_rows(client, monkeypatch):
+    monkeypatch.setattr(settings, "LIVE_FEED_MODE", "inprocess")
+
+    async def scenario():
+        feed = LiveFeed()
+        queue = await feed.subscribe()
+        settled_id = max_id() + 1
+        insert_feedback(settled_id, age_seconds=settings.LIVE_FEED_SETTLE_SECONDS + 60)
+        await feed._poll_once()
+
+        assert drain(queue) == [settled_id]
+        assert feed.watermark == settled_id
+        assert settled_id not in feed._seen
+
+    asyncio.run(scenario())
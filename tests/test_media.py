@@ -0,0 +1,39 @@
+import pytest
+from app.core.storage import storage
+
+ARCHIVE_KEY = "archives/feedbacks/2026-01-01/feedbacks-1-2.ndjson.gz"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stored_files():
+    assert storage.save("screenshots/public.webp", b"RIFF0000WEBP", "image/webp")
+    assert storage.save(ARCHIVE_KEY, b"private archive", "application/gzip")
+
+
+def test_serves_public_screenshot(client):
+    response = client.get("/media/screenshots/public.webp")
+    assert response.status_code == 200
+    assert response.content == b"RIFF0000WEBP"
+
+
+@pytest.mark.parametrize("path", [
+    f"/media/screenshots/%2e%2e/{ARCHIVE_KEY}",
+    f"/media/screenshots/%2E%2E/{ARCHIVE_KEY}",
+    f"/media/screenshots/..%2f{ARCHIVE_KEY}",
+    f"/media/screenshots/./%2e%2e/{ARCHIVE_KEY}",
+    f"/media/{ARCHIVE_KEY}",
+])
+def test_rejects_paths_outside_public_folders(client, path):
+    response = client.get(path)
+    assert response.status_code == 404
+    assert b"private archive" not in response.content
+
+
+@pytest.mark.parametrize("key", [
+    "screenshots/../archives/x.gz",
+    "screenshots/./public.webp",
+    "screenshots//public.webp",
+    "../outside.webp",
+])
+def test_path_for_rejects_dot_and_empty_segments(key):
+    assert storage.path_for(key) is None
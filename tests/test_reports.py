@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+
+
+def test_report_is_revalidated_by_etag_only(client, admin_headers):
+    db = SessionLocal()
+    try:
+        old = Feedback(
+            name="Old",
+            email="old@example.com",
+            rating=1,
+            client_ip="203.0.113.7",
+            created_at=datetime.now(timezone.utc) - timedelta(days=400)
+        )
+        db.add(old)
+        db.commit()
+        old_id = old.id
+    finally:
+        db.close()
+
+    response = client.get("/api/analytics/reports", headers=admin_headers)
+    assert response.status_code == 200
+    assert "last-modified" not in response.headers
+    etag = response.headers["etag"]
+
+    # Purging an old row leaves max(created_at) alone but must change the version
+    db = SessionLocal()
+    try:
+        db.query(Feedback).filter(Feedback.id == old_id).delete()
+        db.commit()
+    finally:
+        db.close()
+
+    revalidated = client.get(
+        "/api/analytics/reports",
+        headers={**admin_headers, "If-None-Match": etag}
+    )
+    assert revalidated.status_code == 200
+    assert revalidated.json()["total_feedbacks"] == response.json()["total_feedbacks"] - 1
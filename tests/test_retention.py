@@ -0,0 +1,44 @@
+import fcntl
+from datetime import datetime, timedelta, timezone
+from app.core.retention import RUN_LOCK_FILE, retention_job
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+
+
+def test_manual_run_conflicts_with_another_worker(client, admin_headers):
+    # Another worker process holding the run lock
+    with open(RUN_LOCK_FILE, "w") as other_worker:
+        fcntl.flock(other_worker, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        response = client.post("/api/admin/retention/run?days=3650", headers=admin_headers)
+        assert response.status_code == 409
+        assert not retention_job.running
+
+    response = client.post("/api/admin/retention/run?days=3650", headers=admin_headers)
+    assert response.status_code == 202
+    # The background task has finished and released both locks
+    assert not retention_job.running
+    assert retention_job.try_lock()
+    retention_job.unlock()
+
+
+def test_failed_manual_run_does_not_raise(client, admin_headers, monkeypatch):
+    db = SessionLocal()
+    try:
+        db.add(Feedback(
+            name="Old",
+            email="old@example.com",
+            rating=3,
+            client_ip="203.0.113.7",
+            created_at=datetime.now(timezone.utc) - timedelta(days=30)
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+    def broken_archive(rows, cutoff):
+        raise RuntimeError("storage exploded")
+
+    monkeypatch.setattr(retention_job, "_archive_batch", broken_archive)
+    response = client.post("/api/admin/retention/run?days=7", headers=admin_headers)
+    assert response.status_code == 202
+    assert not retention_job.running
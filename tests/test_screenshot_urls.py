@@ -0,0 +1,51 @@
+import pytest
+import app.core.screenshot_urls as screenshot_urls_module
+from app.core.storage import LocalStorageBackend
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+
+
+class SigningBackend(LocalStorageBackend):
+    """Local backend that marks URLs as signed, standing in for S3"""
+
+    def signed_url(self, key: str, expires_in: int) -> str:
+        return f"{self.url_for(key)}?signature=test"
+
+
+@pytest.fixture
+def signing_storage(monkeypatch, tmp_path):
+    backend = SigningBackend(str(tmp_path), "/media")
+    monkeypatch.setattr(screenshot_urls_module, "storage", backend)
+    screenshot_urls_module.screenshot_urls._cache.clear()
+    return backend
+
+
+@pytest.fixture
+def feedback_id(client):
+    db = SessionLocal()
+    try:
+        feedback = Feedback(
+            name="Customer",
+            email="customer@example.com",
+            rating=2,
+            screenshot_url="/media/screenshots/shot.webp",
+            client_ip="203.0.113.7"
+        )
+        db.add(feedback)
+        db.commit()
+        return feedback.id
+    finally:
+        db.close()
+
+
+def test_public_feedback_endpoint_never_signs(client, signing_storage, feedback_id):
+    response = client.get(f"/api/feedback/{feedback_id}")
+    assert response.status_code == 200
+    assert response.json()["screenshot_url"] == "/media/screenshots/shot.webp"
+
+
+def test_admin_list_signs_screenshot_urls(client, signing_storage, feedback_id, admin_headers):
+    response = client.get("/api/analytics/feedbacks?limit=500", headers=admin_headers)
+    assert response.status_code == 200
+    feedback = next(f for f in response.json()["feedbacks"] if f["id"] == feedback_id)
+    assert feedback["screenshot_url"] == "/media/screenshots/shot.webp?signature=test"
@@ -0,0 +1,95 @@
+from datetime import datetime, time, timedelta, timezone
+from sqlalchemy import func
+from app.core.term_index import term_index
+from app.database import SessionLocal
+from app.models.feedback import Feedback
+from app.models.term_count import TermCount
+from app.terms import tokenize
+
+
+def term_total(term: str) -> int:
+    db = SessionLocal()
+    try:
+        return db.query(func.sum(TermCount.count)).filter(TermCount.term == term).scalar() or 0
+    finally:
+        db.close()
+
+
+def add_feedback(description: str, days_ago: int = 0, rating: int = 2) -> int:
+    day = datetime.now(timezone.utc).date() - timedelta(days=days_ago)
+    db = SessionLocal()
+    try:
+        feedback = Feedback(
+            name="Customer",
+            email="customer@example.com",
+            rating=rating,
+            description=description,
+            client_ip="203.0.113.7",
+            created_at=datetime.combine(day, time(12), tzinfo=timezone.utc)
+        )
+        db.add(feedback)
+        db.commit()
+        return feedback.id
+    finally:
+        db.close()
+
+
+def test_tokenize():
+    assert tokenize("The Checkout didn't load, checkout FAILED 3 times at 10:00!") == {
+        "checkout", "load", "failed", "times"
+    }
+    assert tokenize("l'app") == {"l'app"}
+    assert tokenize(None) == set()
+
+
+def test_submission_and_backfill_count_a_feedback_once(client):
+    response = client.post(
+        "/api/feedback/",
+        data={"name": "Customer", "email": "customer@example.com", "rating": "1",
+              "description": "Zephyrwidget broke, zephyrwidget again"}
+    )
+    assert response.status_code == 201
+    # The submission's background task has indexed the row already
+    term_index.backfill()
+    assert term_total("zephyrwidget") == 1
+
+
+def test_late_index_task_skips_a_backfilled_row(client):
+    feedback_id = add_feedback("Quokkalatch jammed")
+    term_index.backfill()
+    assert term_total("quokkalatch") == 1
+
+    # The submission's own task runs after the backfill claimed the row
+    db = SessionLocal()
+    try:
+        feedback = db.get(Feedback, feedback_id)
+        term_index.index_feedback(feedback.id, feedback.rating, feedback.description, feedback.created_at)
+    finally:
+        db.close()
+    assert term_total("quokkalatch") == 1
+
+
+def test_window_covers_today_and_the_previous_days(client):
+    add_feedback("Insidewindowterm", days_ago=6)
+    add_feedback("Outsidewindowterm", days_ago=7)
+    term_index.backfill()
+
+    db = SessionLocal()
+    try:
+        terms = dict(term_index.top_terms(db, days=7, limit=200))
+    finally:
+        db.close()
+    assert terms.get("insidewindowterm") == 1
+    assert "outsidewindowterm" not in terms
+
+
+def test_rating_range(client, admin_headers):
+    add_feedback("Ratingfivethanks", rating=5)
+    term_index.backfill()
+
+    response = client.get("/api/analytics/terms?max_rating=2&limit=200", headers=admin_headers)
+    assert response.status_code == 200
+    assert "ratingfivethanks" not in {term["term"] for term in response.json()["terms"]}
+
+    response = client.get("/api/analytics/terms?min_rating=4&max_rating=2", headers=admin_headers)
+    assert response.status_code == 400
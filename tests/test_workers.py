@@ -0,0 +1,36 @@
+import app.config as config
+from app.core.concurrency import clamp_to_pool
+from app.database import BACKGROUND_CONNECTIONS
+
+
+def _cpu_max(monkeypatch, tmp_path, content):
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text(content)
+    real_open = open
+    monkeypatch.setattr(
+        "builtins.open",
+        lambda path, *args, **kwargs: real_open(cpu_max if path == "/sys/fs/cgroup/cpu.max" else path, *args, **kwargs)
+    )
+
+
+def test_cgroup_quota_caps_workers(monkeypatch, tmp_path):
+    _cpu_max(monkeypatch, tmp_path, "150000 100000\n")
+    monkeypatch.setattr(config.os, "sched_getaffinity", lambda pid: set(range(64)), raising=False)
+    assert config._cgroup_cpu_limit() == 1.5
+    assert config.available_cpus() == 2
+
+
+def test_unlimited_cgroup_uses_affinity(monkeypatch, tmp_path):
+    _cpu_max(monkeypatch, tmp_path, "max 100000\n")
+    monkeypatch.setattr(config.os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+    assert config._cgroup_cpu_limit() is None
+    assert config.available_cpus() == 8
+
+
+def test_limits_clamped_to_pool():
+    maxima = {"public_write": 20, "admin_read": 8, "export": 2}
+    assert clamp_to_pool(maxima, 40) == maxima
+
+    clamped = clamp_to_pool(maxima, 10 + BACKGROUND_CONNECTIONS)
+    assert sum(clamped.values()) <= 10
+    assert all(limit >= 1 for limit in clamped.values())